@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Lead Assignment Rules for GotIt CRM
+Compiles GOT IT's priority-ordered assignment rules into a decision table over
+industry, region, customer type and order value, so routing a lead is one
+dictionary lookup, then picks a salesperson of the team by round-robin or by
+current load. Rules can be loaded from a JSON file and hot-reloaded: each
+version becomes an immutable snapshot that is swapped in atomically.
+"""
+
+import argparse
+import bisect
+import hashlib
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+
+# Import local modules
+import config
+import vietnam_data as vn
+
+
+# Rule dimensions, in GOT IT's priority order
+DIMENSIONS = ('industry', 'region', 'customer_type', 'order_value')
+
+# Values a rule may name per dimension
+DIMENSION_VALUES = {
+    'industry': list(config.INDUSTRY_DISTRIBUTION),
+    'region': list(config.REGION_DISTRIBUTION),
+    'customer_type': list(config.CUSTOMER_TYPE_DISTRIBUTION),
+    'order_value': list(config.ORDER_VALUE_DISTRIBUTION),
+}
+
+# Table slot for any other value (unknown region, missing industry, ...)
+OTHER = '*'
+
+# Order value bands for leads that carry an amount in VND instead of a band label
+ORDER_VALUE_LABELS = [band['label'] for band in vn.ORDER_VALUE_RANGES]
+ORDER_VALUE_BOUNDS = [band['min'] * 1_000_000 for band in vn.ORDER_VALUE_RANGES[1:]]
+
+TIE_BREAKING = ('round_robin', 'load_balanced')
+
+Assignment = namedtuple('Assignment', ['team', 'user_id', 'rule', 'version'])
+
+# A compiled, read-only version of the rules
+RuleSnapshot = namedtuple('RuleSnapshot', ['version', 'rules', 'checksum', 'source', 'loaded_at'])
+
+
+def order_value_band(value):
+    """Band label of an order value given in VND (labels are returned unchanged)"""
+    if not value or isinstance(value, str):
+        return value
+    return ORDER_VALUE_LABELS[bisect.bisect_right(ORDER_VALUE_BOUNDS, value)]
+
+
+class RuleSet:
+    """Priority-ordered assignment rules compiled into a decision table"""
+
+    def __init__(self, rules, dimensions=None):
+        """
+        Validate and compile rules
+
+        Args:
+            rules: List of dicts with 'name', 'team' and, per dimension, the
+                accepted values (a dimension left out matches anything)
+            dimensions: Optional dict of dimension -> known values, replacing
+                those of DIMENSION_VALUES (e.g. to add a region)
+
+        Raises:
+            ValueError: A rule has no team or names an unknown dimension value
+        """
+        self.dimensions = dict(DIMENSION_VALUES)
+        for dimension, values in (dimensions or {}).items():
+            if dimension not in DIMENSION_VALUES:
+                raise ValueError(f"Unknown assignment dimension: {dimension}")
+            self.dimensions[dimension] = list(values)
+
+        self.rules = [self._compile_rule(position, rule) for position, rule in enumerate(rules)]
+
+        # Raw value -> table slot, per dimension
+        self._slots = {dimension: {value: value for value in values}
+                       for dimension, values in self.dimensions.items()}
+
+        # Every combination of dimension values (and OTHER) -> first matching rule.
+        # Rules are applied from lowest to highest priority, so higher ones overwrite.
+        slots = [self.dimensions[dimension] + [OTHER] for dimension in DIMENSIONS]
+        self.table = {}
+        for rule in reversed(self.rules):
+            covered = [all_values if values is None else values
+                       for all_values, values in zip(slots, rule['conditions'])]
+            self.table.update(dict.fromkeys(itertools.product(*covered), rule))
+
+    def __len__(self):
+        return len(self.rules)
+
+    def _compile_rule(self, position, rule):
+        """Rule with its conditions as one frozenset (or None for 'any') per dimension"""
+        name = rule.get('name') or f"Rule {position + 1}"
+        if not rule.get('team'):
+            raise ValueError(f"Assignment rule '{name}' has no team")
+
+        conditions = []
+        for dimension in DIMENSIONS:
+            values = rule.get(dimension)
+            if values is None:
+                conditions.append(None)
+                continue
+            values = frozenset([values] if isinstance(values, str) else values)
+            unknown = values - set(self.dimensions[dimension])
+            if unknown:
+                raise ValueError(f"Assignment rule '{name}': unknown {dimension} {sorted(unknown)}")
+            conditions.append(values)
+
+        return {'name': name, 'team': rule['team'], 'conditions': tuple(conditions)}
+
+    def _first_match(self, key):
+        """First rule accepting a table key, by linear scan"""
+        for rule in self.rules:
+            if all(values is None or value in values for values, value in zip(rule['conditions'], key)):
+                return rule
+        return None
+
+    def key(self, lead):
+        """Table key of a lead (dict with the DIMENSIONS; order_value may be an amount)"""
+        slots = self._slots
+        return (
+            slots['industry'].get(lead.get('industry'), OTHER),
+            slots['region'].get(lead.get('region'), OTHER),
+            slots['customer_type'].get(lead.get('customer_type'), OTHER),
+            slots['order_value'].get(order_value_band(lead.get('order_value')), OTHER),
+        )
+
+    def match(self, lead):
+        """First rule matching a lead, or None"""
+        return self.table.get(self.key(lead))
+
+    def match_linear(self, lead):
+        """Same as match() by scanning the rules (reference implementation)"""
+        return self._first_match(self.key(lead))
+
+
+class TeamQueue:
+    """Salespeople of one team and the tie-breaking between them"""
+
+    def __init__(self, members, strategy='round_robin', loads=None):
+        """
+        Args:
+            members: User IDs of the team, in round-robin order
+            strategy: 'round_robin' or 'load_balanced'
+            loads: Optional dict of user ID -> open leads at start
+        """
+        if strategy not in TIE_BREAKING:
+            raise ValueError(f"Unknown tie-breaking strategy: {strategy}")
+
+        self.members = list(members)
+        self.strategy = strategy
+        self.loads = {user_id: (loads or {}).get(user_id, 0) for user_id in self.members}
+        self._turns = itertools.cycle(self.members)
+        self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        """Heap of (load, position, user ID): least loaded first, ties in member order"""
+        self._heap = [(self.loads[user_id], position, user_id) for position, user_id in enumerate(self.members)]
+        heapq.heapify(self._heap)
+
+    def next(self):
+        """Pick the salesperson for the next lead, or None for an empty team"""
+        if not self.members:
+            return None
+
+        if self.strategy == 'round_robin':
+            user_id = next(self._turns)
+        else:
+            load, position, user_id = self._heap[0]
+            heapq.heapreplace(self._heap, (load + 1, position, user_id))
+
+        self.loads[user_id] += 1
+        return user_id
+
+    def set_load(self, user_id, load):
+        """Correct a salesperson's load (e.g. after leads were closed or reassigned)"""
+        self.loads[user_id] = load
+        self._rebuild_heap()
+
+
+class RuleStore:
+    """
+    Versioned rule snapshots with atomic replacement
+
+    The current snapshot is a single attribute: readers take it without a
+    lock and keep using it for a whole batch, while a reload compiles the
+    new rules first and then swaps the reference. Every published snapshot
+    stays in the history, so past assignments can be re-evaluated with the
+    version that made them.
+    """
+
+    def __init__(self):
+        """Create an empty store (use from_config, from_rules or from_file)"""
+        self.history = {}
+        self.current = None
+        self.path = None
+        self._file_state = None
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher = None
+
+    @classmethod
+    def from_rules(cls, rules, dimensions=None, source='api'):
+        """Store whose first snapshot holds the given rules"""
+        store = cls()
+        store.publish(rules, dimensions, source)
+        return store
+
+    @classmethod
+    def from_file(cls, path):
+        """Store whose first snapshot is loaded from a JSON rules file"""
+        store = cls()
+        store.load_file(path)
+        return store
+
+    @classmethod
+    def from_config(cls):
+        """Store for ASSIGNMENT_CONFIG['rules_file'] if set, else for ASSIGNMENT_RULES"""
+        path = config.ASSIGNMENT_CONFIG.get('rules_file')
+        if path:
+            return cls.from_file(path)
+        return cls.from_rules(config.ASSIGNMENT_RULES, source='config')
+
+    def publish(self, rules, dimensions=None, source='api'):
+        """
+        Compile rules into a new snapshot and make it current
+
+        Rows read from a database table can be published directly. Unchanged
+        rules do not create a new version.
+
+        Returns:
+            The current RuleSnapshot
+
+        Raises:
+            ValueError: The rules are invalid (the current snapshot is kept)
+        """
+        checksum = hashlib.sha256(
+            json.dumps({'rules': rules, 'dimensions': dimensions}, sort_keys=True, ensure_ascii=False).encode()
+        ).hexdigest()
+
+        with self._write_lock:
+            if self.current is not None and self.current.checksum == checksum:
+                return self.current
+
+            compiled = RuleSet(rules, dimensions)
+            version = len(self.history) + 1
+            snapshot = RuleSnapshot(version, compiled, checksum, source, time.time())
+            self.history[version] = snapshot
+            self.current = snapshot
+            return snapshot
+
+    def load_file(self, path):
+        """
+        Load rules from a JSON file: a list of rules, or an object with
+        'rules' and optional 'dimensions'
+        """
+        state = self._stat(path)
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            data = {'rules': data}
+
+        snapshot = self.publish(data['rules'], data.get('dimensions'), source=path)
+        self.path = path
+        self._file_state = state
+        return snapshot
+
+    def reload_if_changed(self):
+        """
+        Reload the rules file if it was modified since it was last loaded
+
+        Returns:
+            The new RuleSnapshot, or None if nothing changed
+        """
+        if self.path is None:
+            return None
+        state = self._stat(self.path)
+        if state == self._file_state:
+            return None
+
+        # A broken file is reported once, not on every poll
+        self._file_state = state
+        previous = self.current
+        snapshot = self.load_file(self.path)
+        return snapshot if snapshot is not previous else None
+
+    @staticmethod
+    def _stat(path):
+        """Modification time and size of a file"""
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def watch(self, interval=None):
+        """Poll the rules file in a background thread and reload it on change"""
+        interval = interval or config.ASSIGNMENT_CONFIG['reload_interval']
+        if self.path is None:
+            raise RuntimeError("No rules file loaded to watch")
+        if self._watcher is not None:
+            return
+
+        def poll():
+            while not self._stop.wait(interval):
+                try:
+                    snapshot = self.reload_if_changed()
+                except (OSError, ValueError, KeyError) as e:
+                    # Keep serving the current rules until the file is fixed
+                    print(f"  ⚠ Assignment rules not reloaded from {self.path}: {e}")
+                    continue
+                if snapshot is not None:
+                    print(f"  → Assignment rules v{snapshot.version} loaded from {self.path}")
+
+        self._stop.clear()
+        self._watcher = threading.Thread(target=poll, name='assignment-rules-watcher', daemon=True)
+        self._watcher.start()
+
+    def stop(self):
+        """Stop watching the rules file"""
+        if self._watcher is not None:
+            self._stop.set()
+            self._watcher.join()
+            self._watcher = None
+
+    def snapshot(self, version=None):
+        """A snapshot by version (the current one by default)"""
+        if version is None:
+            return self.current
+        if version not in self.history:
+            raise KeyError(f"No assignment rules version {version}")
+        return self.history[version]
+
+
+class AssignmentEngine:
+    """Assign leads to a team by the rules and to a salesperson by tie-breaking"""
+
+    def __init__(self, rules=None, teams=None, strategy=None, loads=None, store=None):
+        """
+        Args:
+            rules: Rule dicts (defaults to the rules file or config.ASSIGNMENT_RULES)
+            teams: Dict of team name -> member user IDs
+            strategy: Tie-breaking strategy (defaults to ASSIGNMENT_CONFIG['tie_breaking'])
+            loads: Optional dict of user ID -> open leads at start
+            store: RuleStore to share with other engines (replaces rules)
+        """
+        if store is None:
+            store = RuleStore.from_config() if rules is None else RuleStore.from_rules(rules)
+        self.store = store
+        self.strategy = strategy or config.ASSIGNMENT_CONFIG['tie_breaking']
+        self.queues = {team: TeamQueue(members, self.strategy, loads)
+                       for team, members in (teams or {}).items()}
+        self._lock = threading.Lock()
+
+    @property
+    def rules(self):
+        """Compiled rules of the current snapshot"""
+        return self.store.current.rules
+
+    def assign(self, lead):
+        """Assign one lead and return its Assignment(team, user_id, rule, version)"""
+        return self.assign_many([lead])[0]
+
+    def assign_many(self, leads):
+        """
+        Assign a batch of leads
+
+        The whole batch uses the snapshot that is current when it starts, and
+        rules are matched without locking. Salespeople are picked under one
+        lock per batch, so concurrent bursts share the round-robin / load
+        state correctly.
+
+        Returns:
+            List of Assignment(team, user_id, rule, version), one per lead
+            (team, user and rule are None if no rule matched)
+        """
+        snapshot = self.store.current
+        matched = list(map(snapshot.rules.match, leads))
+        with self._lock:
+            return [self._assignment(rule, snapshot.version) for rule in matched]
+
+    def reevaluate(self, leads, version=None):
+        """
+        Route leads with a given rules version, without picking salespeople
+
+        Returns:
+            List of Assignment with user_id None
+        """
+        snapshot = self.store.snapshot(version)
+        return [Assignment(rule['team'], None, rule['name'], snapshot.version) if rule
+                else Assignment(None, None, None, snapshot.version)
+                for rule in map(snapshot.rules.match, leads)]
+
+    def _assignment(self, rule, version):
+        """Assignment for a matched rule"""
+        if rule is None:
+            return Assignment(None, None, None, version)
+        queue = self.queues.get(rule['team'])
+        return Assignment(rule['team'], queue.next() if queue else None, rule['name'], version)
+
+    def set_load(self, user_id, load):
+        """Correct a salesperson's load in every team they belong to"""
+        with self._lock:
+            for queue in self.queues.values():
+                if user_id in queue.loads:
+                    queue.set_load(user_id, load)
+
+
+def export_rules(path):
+    """Write config.ASSIGNMENT_RULES and the dimension values to a JSON rules file"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'dimensions': DIMENSION_VALUES, 'rules': config.ASSIGNMENT_RULES},
+                  f, ensure_ascii=False, indent=2)
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Manage GotIt CRM lead assignment rules')
+    parser.add_argument('--export', metavar='PATH', help='Write the config rules to a JSON rules file')
+    parser.add_argument('--check', metavar='PATH', help='Validate and compile a JSON rules file')
+
+    args = parser.parse_args()
+    if not args.export and not args.check:
+        parser.error('one of --export or --check is required')
+
+    try:
+        if args.export:
+            export_rules(args.export)
+            print(f"✓ {len(config.ASSIGNMENT_RULES)} rules written to {args.export}")
+
+        if args.check:
+            snapshot = RuleStore.from_file(args.check).current
+            print(f"✓ {args.check}: {len(snapshot.rules)} rules, "
+                  f"{len(snapshot.rules.table):,} table entries")
+
+    except (OSError, ValueError, KeyError) as e:
+        print(f"\n❌ Error: {str(e)}")
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark the phone / email / MST normalizers
+
+Feeds each normalizer a mix of the formats seen in real imports and reports
+nanoseconds per value without memoization, with a cold cache and with a
+warm cache, plus the batch API on a stream that repeats values.
+
+Usage:
+    python demo_data/benchmarks/bench_normalization.py [--values 200000] [--keys 20000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# Allow running from the demo_data directory or from benchmarks/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import normalization  # noqa: E402
+import vietnam_data as vn  # noqa: E402
+
+# Current 2-digit mobile prefix -> the legacy 3-digit prefix it replaced
+LEGACY_PREFIXES = {new: old for old, new in normalization.LEGACY_MOBILE_PREFIXES.items()}
+
+
+def phone_variants(phone):
+    """The same +84 number written as it appears in imports"""
+    national = '0' + phone[3:]
+    return [
+        phone,
+        f"{national[:4]} {national[4:7]} {national[7:]}",
+        f"84-{phone[3:6]}-{phone[6:9]}-{phone[9:]}",
+        f"+84 {phone[3:6]}.{phone[6:9]}.{phone[9:]}",
+    ]
+
+
+def legacy_phone_variants(phone):
+    """The same +84 mobile written with its pre-2018 11-digit prefix, if it had one"""
+    legacy = LEGACY_PREFIXES.get(phone[3:5])
+    if legacy is None:
+        return []
+    rest = phone[5:]
+    return [
+        f"+84{legacy}{rest}",
+        f"0{legacy}{rest}",
+        f"+84 {legacy} {rest[:3]} {rest[3:]}",
+        f"84-{legacy}-{rest[:3]}-{rest[3:]}",
+    ]
+
+
+def email_variants(email):
+    """The same email with different case and display forms"""
+    return [email, email.upper(), f"Contact <{email.title()}>", f" {email} "]
+
+
+def vat_variants(vat):
+    """The same MST with separators, prefix and branch suffix"""
+    return [vat, f"{vat[:3]} {vat[3:6]} {vat[6:]}", f"VN{vat}", f"{vat}-001"]
+
+
+def build_inputs(keys, seed):
+    """Distinct raw values per normalizer"""
+    rng = vn.make_rng(seed)
+    phones = vn.generate_phones(keys // 4, rng=rng, unique=True)
+    names = vn.generate_person_names(keys // 4, rng=rng)
+    companies = vn.generate_company_names(keys // 4, rng=rng)
+    emails = vn.generate_emails(names, companies, unique=True)
+    vats = vn.generate_tax_ids(keys // 4, rng=rng, unique=True)
+
+    return {
+        'phone': [variant for phone in phones for variant in phone_variants(phone)],
+        'email': [variant for email in emails for variant in email_variants(email)],
+        'vat': [variant for vat in vats for variant in vat_variants(vat)],
+    }
+
+
+def ns_per_value(func, values):
+    """Average time of func over values, in nanoseconds"""
+    started = time.perf_counter()
+    for value in values:
+        func(value)
+    return (time.perf_counter() - started) / len(values) * 1e9
+
+
+def measure(key, distinct, stream):
+    """Time one normalizer in every mode"""
+    normalize = normalization.NORMALIZERS[key]
+    batch = {'phone': normalization.normalize_phones,
+             'email': normalization.normalize_emails,
+             'vat': normalization.normalize_vats}[key]
+
+    normalization.clear_caches()
+    uncached = ns_per_value(normalize.__wrapped__, distinct)
+    normalization.clear_caches()
+    cold = ns_per_value(normalize, distinct)
+    warm = ns_per_value(normalize, distinct)
+
+    normalization.clear_caches()
+    started = time.perf_counter()
+    batch(stream)
+    batch_ns = (time.perf_counter() - started) / len(stream) * 1e9
+
+    # Every written form of a value must give the same key
+    groups = [distinct[start:start + 4] for start in range(0, len(distinct), 4)]
+    expected = [len({normalize(value) for value in group[:3]}) == 1 for group in groups]
+    assert all(expected), f"{key}: variants normalized differently"
+
+    return {'uncached': uncached, 'cold': cold, 'warm': warm, 'batch': batch_ns}
+
+
+def check_consistency(phones):
+    """Every format of a phone, legacy prefixes included, gives one key from both APIs"""
+    for phone in phones:
+        variants = phone_variants(phone) + legacy_phone_variants(phone)
+        normalization.clear_caches()
+        single = [normalization.normalize_phone(variant) for variant in variants]
+        assert single == normalization.normalize_phones(variants), f"{phone}: batch and single results differ"
+        assert set(single) == {phone}, f"{phone}: variants normalized to {sorted(set(single), key=str)}"
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Benchmark matching key normalization')
+    parser.add_argument('--values', type=int, default=200_000, help='Values in the batch stream')
+    parser.add_argument('--keys', type=int, default=20_000, help='Distinct raw values per normalizer')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    args = parser.parse_args()
+
+    inputs = build_inputs(args.keys, args.seed)
+    rng = random.Random(args.seed)
+    check_consistency(inputs['phone'][::4] + ['+84321234567', '+84701234567'])
+
+    print(f"Normalization benchmark ({args.keys:,} distinct values, "
+          f"batch of {args.values:,}, cache size {normalization.CACHE_SIZE:,})")
+    print(f"  {'normalizer':<10} {'uncached':>10} {'cold':>10} {'warm':>10} {'batch':>10}   (ns/value)")
+    for key, distinct in inputs.items():
+        stream = rng.choices(distinct, k=args.values)
+        result = measure(key, distinct, stream)
+        print(f"  {key:<10} {result['uncached']:>10,.0f} {result['cold']:>10,.0f} "
+              f"{result['warm']:>10,.0f} {result['batch']:>10,.0f}")
+
+
+if __name__ == '__main__':
+    main()
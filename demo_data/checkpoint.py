@@ -0,0 +1,138 @@
+"""
+Checkpoint journal for resumable demo data generation
+
+Every completed chunk (create or write call) is appended to a JSONL file with
+the IDs it produced, together with markers for tagged chunks and completed
+phases. A resumed run replays the generator with the same seed and settings:
+chunks found in the journal return their recorded IDs instead of calling Odoo
+again, and only the ones never tagged are tagged.
+"""
+
+import json
+import os
+import threading
+
+
+class CheckpointJournal:
+    """Append-only JSONL journal of completed phases and chunks"""
+
+    def __init__(self, path, settings, chunks=None, tagged=None, phases=None, completed=False):
+        """Use start() or resume() instead of creating a journal directly"""
+        self.path = path
+        self.settings = settings
+        self.completed = completed
+        self._chunks = chunks or {}
+        self._tagged = tagged or set()
+        self._phases = phases or []
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    @classmethod
+    def start(cls, path, settings):
+        """Start a new journal, replacing any previous one"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8'):
+            pass
+
+        journal = cls(path, settings)
+        journal._append({'event': 'start', 'settings': settings})
+        return journal
+
+    @classmethod
+    def resume(cls, path):
+        """Open an existing journal and load what it recorded"""
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No checkpoint journal at {path}")
+
+        settings = None
+        chunks = {}
+        tagged = set()
+        phases = []
+        completed = False
+        # Byte offset just past the last complete line
+        complete_end = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # A torn last line from an interrupted write
+                    break
+                complete_end += len(line)
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+
+                event = entry.get('event')
+                if event == 'start':
+                    settings = entry['settings']
+                elif event == 'chunk':
+                    chunks[entry['key']] = entry['ids']
+                elif event == 'tagged':
+                    tagged.add(entry['key'])
+                elif event == 'phase':
+                    phases.append(entry['phase'])
+                elif event == 'complete':
+                    completed = True
+
+        if settings is None:
+            raise ValueError(f"Checkpoint journal {path} has no start entry")
+
+        # Cut the torn line off, or the next entry would be glued onto it
+        if complete_end < os.path.getsize(path):
+            with open(path, 'r+b') as f:
+                f.truncate(complete_end)
+        return cls(path, settings, chunks, tagged, phases, completed)
+
+    @property
+    def chunk_count(self):
+        """Number of journaled chunks"""
+        return len(self._chunks)
+
+    def chunk(self, key):
+        """IDs recorded for a chunk, or None if it was not completed"""
+        return self._chunks.get(key)
+
+    def chunk_tagged(self, key):
+        """Whether the records of a chunk were tagged with the run's external IDs"""
+        return key in self._tagged
+
+    def phase_done(self, phase):
+        """Whether a phase was completed"""
+        return phase in self._phases
+
+    def record_chunk(self, key, ids):
+        """Record a completed chunk"""
+        with self._lock:
+            self._chunks[key] = ids
+        self._append({'event': 'chunk', 'key': key, 'ids': ids})
+
+    def record_tagged(self, key):
+        """Record that the records of a chunk were tagged"""
+        with self._lock:
+            self._tagged.add(key)
+        self._append({'event': 'tagged', 'key': key})
+
+    def record_phase(self, phase):
+        """Record a completed phase"""
+        if phase not in self._phases:
+            self._phases.append(phase)
+            self._append({'event': 'phase', 'phase': phase})
+
+    def complete(self):
+        """Mark the run as finished"""
+        self.completed = True
+        self._append({'event': 'complete'})
+
+    def close(self):
+        """Close the journal file"""
+        self._file.close()
+
+    def _append(self, entry):
+        """Write one entry and make it durable before returning"""
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
@@ -7,15 +7,47 @@ Safely removes all demo data from Odoo to start fresh
 import xmlrpc.client
 import argparse
 import sys
+import threading
+import time
+from collections import defaultdict
 
 # Import local modules
 import config
+from rpc_pool import ProxyPool, WorkerPool, run_concurrently
+
+
+# Seconds between deletion progress lines
+PROGRESS_INTERVAL = 5
+
+# Errors worth retrying an unlink for (anything else is not going to change).
+# A chunk that runs into limit_time_real shows up as one of these: Odoo kills
+# the worker, dropping the connection or answering 502.
+TRANSIENT_ERRORS = (xmlrpc.client.ProtocolError, ConnectionError)
+
+# Deletion order for the records of one run (dependents first)
+RUN_CLEANUP_ORDER = [
+    'mail.activity',
+    'sale.order',
+    'crm.lead',
+    'res.partner',
+    'product.product',
+    'crm.team',
+]
+
+# Models removed by the unlink of their parent (ondelete cascade): only their
+# leftover external IDs are deleted
+RUN_CASCADED_MODELS = {
+    'sale.order.line': 'sale.order',
+}
+
+# External IDs read per search_read when collecting a run's records
+RUN_PAGE_SIZE = 10000
 
 
 class OdooDataCleaner:
     """Clean demo data from Odoo"""
 
-    def __init__(self, url, db, username, password):
+    def __init__(self, url, db, username, password, workers=None, batch_size=None):
         """Initialize connection to Odoo"""
         self.url = url
         self.db = db
@@ -29,20 +61,33 @@ class OdooDataCleaner:
         if not self.uid:
             raise Exception("Authentication failed!")
 
-        self.models = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object')
+        # One object proxy per worker thread (ServerProxy is not thread-safe)
+        self._object_proxies = ProxyPool(f'{url}/xmlrpc/2/object')
+        self.models = self._object_proxies.get()
         print(f"✓ Connected as user ID: {self.uid}\n")
 
         self.stats = {}
+        self.workers = max(1, workers or config.BULK_CONFIG['workers'])
+        self.pool = WorkerPool(self.workers)
+
+        # Chunked deletion: IDs that could not be deleted even one by one
+        self.batch_size = max(1, batch_size or config.BULK_CONFIG['delete_batch_size'])
+        self.failed = defaultdict(list)
+        self._lock = threading.Lock()
 
     def execute(self, model, method, args_list, kwargs_dict=None):
         """Execute a method on an Odoo model"""
         if kwargs_dict is None:
             kwargs_dict = {}
-        return self.models.execute_kw(
+        return self._object_proxies.get().execute_kw(
             self.db, self.uid, self.password,
             model, method, args_list, kwargs_dict
         )
 
+    def close(self):
+        """Stop the worker threads"""
+        self.pool.close()
+
     def search_records(self, model, domain, limit=None):
         """Search for records"""
         kwargs_dict = {}
@@ -55,16 +100,67 @@ class OdooDataCleaner:
         return self.execute(model, 'search_count', [domain])
 
     def delete_records(self, model, record_ids):
-        """Delete records by IDs"""
+        """Delete records by IDs in parallel chunks and return the number deleted"""
         if not record_ids:
             return 0
 
-        try:
-            self.execute(model, 'unlink', [record_ids])
-            return len(record_ids)
-        except Exception as e:
-            print(f"  ⚠ Error deleting {model}: {str(e)[:100]}")
-            return 0
+        chunks = [record_ids[start:start + self.batch_size]
+                  for start in range(0, len(record_ids), self.batch_size)]
+        progress = {'deleted': 0, 'done': 0, 'started': time.time(), 'reported': time.time()}
+
+        def delete_chunk(chunk):
+            failed = self._unlink_chunk(model, chunk)
+            deleted = len(chunk) - len(failed)
+            with self._lock:
+                if failed:
+                    self.failed[model].extend(failed)
+                progress['deleted'] += deleted
+                progress['done'] += len(chunk)
+                now = time.time()
+                rate = progress['done'] / max(now - progress['started'], 1e-6)
+                # Report at most every few seconds, and once at the end
+                finished = progress['done'] == len(record_ids)
+                if len(chunks) > 1 and (finished or now - progress['reported'] >= PROGRESS_INTERVAL):
+                    progress['reported'] = now
+                    print(f"  → {model}: {progress['done']:,}/{len(record_ids):,} processed, "
+                          f"{progress['deleted']:,} deleted ({rate:,.0f} records/s)")
+            return deleted
+
+        return sum(self.pool.map(delete_chunk, chunks))
+
+    def _unlink_chunk(self, model, record_ids):
+        """
+        Unlink a chunk, retrying connection errors
+
+        A chunk Odoo refuses (xmlrpc Fault) or that keeps failing (e.g. too
+        big for limit_time_real) is split in half until the records that
+        cannot be deleted are isolated. Only a single record that still
+        cannot be sent raises, since Odoo is then unreachable.
+
+        Returns:
+            IDs that could not be deleted
+        """
+        retries = config.BULK_CONFIG['delete_retries']
+        for attempt in range(retries + 1):
+            try:
+                self.execute(model, 'unlink', [record_ids])
+                return []
+            except xmlrpc.client.Fault as e:
+                error = e
+                break
+            except TRANSIENT_ERRORS as e:
+                error = e
+                if attempt < retries:
+                    time.sleep(config.BULK_CONFIG['retry_delay'] * (attempt + 1))
+
+        if len(record_ids) == 1:
+            if not isinstance(error, xmlrpc.client.Fault):
+                raise error
+            print(f"  ⚠ Could not delete {model} {record_ids[0]}: {error.faultString.strip().splitlines()[-1][:100]}")
+            return list(record_ids)
+
+        middle = len(record_ids) // 2
+        return self._unlink_chunk(model, record_ids[:middle]) + self._unlink_chunk(model, record_ids[middle:])
 
     def clean_activities(self):
         """Delete all activities"""
@@ -90,8 +186,7 @@ class OdooDataCleaner:
             # First, try to cancel confirmed orders by setting state
             print(f"  → Cancelling {len(order_ids)} sale orders...")
             try:
-                # Set state to 'cancel' for all orders
-                self.execute('sale.order', 'write', [order_ids, {'state': 'cancel'}])
+                self.cancel_orders(order_ids)
                 print(f"  → Cancelled {len(order_ids)} orders")
             except Exception as e:
                 print(f"  ⚠ Could not cancel all orders: {str(e)[:80]}")
@@ -112,6 +207,12 @@ class OdooDataCleaner:
             print(f"  → No sale orders to delete")
             return 0
 
+    def cancel_orders(self, order_ids):
+        """Set sale orders to 'cancel' (confirmed orders cannot be deleted), one write per chunk"""
+        chunks = [order_ids[start:start + self.batch_size]
+                  for start in range(0, len(order_ids), self.batch_size)]
+        self.pool.map(lambda chunk: self.execute('sale.order', 'write', [chunk, {'state': 'cancel'}]), chunks)
+
     def clean_products(self):
         """Delete all products (except system defaults)"""
         print("\nCleaning Products...")
@@ -223,16 +324,18 @@ class OdooDataCleaner:
         print("\n📊 RECORDS TO BE DELETED:")
         print("-" * 70)
 
-        counts = {
-            'Activities': self.count_records('mail.activity', []),
-            'Sale Orders (& lines)': self.count_records('sale.order', []),
-            'Products (demo)': self.count_records('product.product', [('create_uid', '!=', 1)]),
-            'Opportunities': self.count_records('crm.lead', [('type', '=', 'opportunity')]),
-            'Leads': self.count_records('crm.lead', [('type', '=', 'lead')]),
-            'Customers/Partners': self.count_records('res.partner', [('is_company', '=', True), ('id', '>', 3)]),
-            'Sales Teams (demo)': self.count_records('crm.team', [('create_uid', '!=', 1)]),
-            'CRM Stages (demo)': self.count_records('crm.stage', [('create_uid', '!=', 1)]),
+        queries = {
+            'Activities': ('mail.activity', []),
+            'Sale Orders (& lines)': ('sale.order', []),
+            'Products (demo)': ('product.product', [('create_uid', '!=', 1)]),
+            'Opportunities': ('crm.lead', [('type', '=', 'opportunity')]),
+            'Leads': ('crm.lead', [('type', '=', 'lead')]),
+            'Customers/Partners': ('res.partner', [('is_company', '=', True), ('id', '>', 3)]),
+            'Sales Teams (demo)': ('crm.team', [('create_uid', '!=', 1)]),
+            'CRM Stages (demo)': ('crm.stage', [('create_uid', '!=', 1)]),
         }
+        results = self.pool.map(lambda query: self.count_records(*query), queries.values())
+        counts = dict(zip(queries, results))
 
         total = 0
         for name, count in counts.items():
@@ -267,17 +370,131 @@ class OdooDataCleaner:
         print("=" * 70 + "\n")
 
         # Clean in order (dependencies first)
-        self.clean_activities()
-        self.clean_quotations()
-        self.clean_opportunities()
-        self.clean_leads()
-        self.clean_customers(keep_admin=True)
-        self.clean_products()
-        self.clean_sales_teams(keep_defaults=True)
-        self.clean_stages(keep_defaults=True)
+        if self.workers > 1:
+            # Phases within a step do not reference each other
+            run_concurrently(self.clean_activities, self.clean_quotations)
+            run_concurrently(self.clean_opportunities, self.clean_leads)
+            self.clean_customers(keep_admin=True)
+            run_concurrently(self.clean_products,
+                             lambda: self.clean_sales_teams(keep_defaults=True),
+                             lambda: self.clean_stages(keep_defaults=True))
+        else:
+            self.clean_activities()
+            self.clean_quotations()
+            self.clean_opportunities()
+            self.clean_leads()
+            self.clean_customers(keep_admin=True)
+            self.clean_products()
+            self.clean_sales_teams(keep_defaults=True)
+            self.clean_stages(keep_defaults=True)
+
+        self.show_cleanup_report()
+
+    # ==================== Run-based Cleanup ====================
+
+    def find_run_records(self, run_id):
+        """Collect the records tagged with a run as {model: [ids]}, paging through ir.model.data"""
+        module = f"{config.RUN_XMLID_PREFIX}{run_id}"
+        records = defaultdict(list)
+        last_id = 0
+
+        while True:
+            # Keyset paging on the indexed module column, no table scans
+            page = self.execute('ir.model.data', 'search_read',
+                                [[('module', '=', module), ('id', '>', last_id)]],
+                                {'fields': ['model', 'res_id'], 'order': 'id', 'limit': RUN_PAGE_SIZE})
+            if not page:
+                break
+            for entry in page:
+                records[entry['model']].append(entry['res_id'])
+            last_id = page[-1]['id']
+
+        return records
+
+    def list_runs(self):
+        """Show the generator runs that still have tagged records"""
+        pattern = config.RUN_XMLID_PREFIX.replace('_', '\\_') + '%'
+        groups = self.execute('ir.model.data', 'read_group',
+                              [[('module', '=like', pattern)], ['module'], ['module']])
+
+        print("\n📋 GENERATOR RUNS:")
+        print("-" * 70)
+        if not groups:
+            print("  (none)")
+        for group in groups:
+            run_id = group['module'][len(config.RUN_XMLID_PREFIX):]
+            print(f"  {run_id:.<50} {group['module_count']:>7,} records")
+
+        return groups
+
+    def clean_run(self, run_id, skip_confirmation=False, preview=False):
+        """Delete exactly the records created by one generator run"""
+        records = self.find_run_records(run_id)
+        cascaded = [model for model in RUN_CASCADED_MODELS if model in records]
+        models = sorted(set(records) - set(cascaded), key=lambda model: RUN_CLEANUP_ORDER.index(model)
+                        if model in RUN_CLEANUP_ORDER else len(RUN_CLEANUP_ORDER))
+
+        print("=" * 70)
+        print(f"RUN CLEANUP: {run_id}")
+        print("=" * 70)
+        print(f"\n📊 RECORDS TAGGED WITH RUN {run_id}:")
+        print("-" * 70)
+        total = 0
+        for model in models + cascaded:
+            print(f"  {model:.<50} {len(records[model]):>7,} records")
+            total += len(records[model])
+        print("-" * 70)
+        print(f"  {'TOTAL':.<50} {total:>7,} records")
+
+        if total == 0:
+            print(f"\n✓ No records found for run {run_id}.")
+            return
+        if preview:
+            return
+
+        if not skip_confirmation:
+            response = input(f"\nType 'yes' to delete these {total:,} records: ")
+            if response.lower() != 'yes':
+                print("Cleanup cancelled.")
+                return
+
+        print()
+        # Confirmed orders cannot be deleted, so cancel them before anything else
+        if records.get('sale.order'):
+            try:
+                self.cancel_orders(records['sale.order'])
+            except Exception as e:
+                print(f"  ⚠ Could not cancel all orders: {str(e)[:80]}")
+
+        for model in models:
+            deleted = self.delete_records(model, records[model])
+            self.stats[model] = deleted
+            print(f"  → Deleted {deleted:,} {model} records")
+
+        for model in cascaded:
+            deleted = self.clean_cascaded(run_id, model, records[model])
+            self.stats[model] = deleted
+            print(f"  → Deleted {deleted:,} {model} records with their {RUN_CASCADED_MODELS[model]}")
 
         self.show_cleanup_report()
 
+    def clean_cascaded(self, run_id, model, record_ids):
+        """
+        Count the records of a run removed by their parent's unlink and
+        delete their leftover external IDs
+
+        Returns:
+            Number of records that no longer exist
+        """
+        remaining = self.search_records(model, [('id', 'in', record_ids)])
+        xmlid_ids = self.search_records('ir.model.data', [
+            ('module', '=', f"{config.RUN_XMLID_PREFIX}{run_id}"),
+            ('model', '=', model),
+            ('res_id', 'not in', remaining),
+        ])
+        self.delete_records('ir.model.data', xmlid_ids)
+        return len(record_ids) - len(remaining)
+
     def show_cleanup_report(self):
         """Show final cleanup report"""
         print("\n" + "=" * 70)
@@ -296,8 +513,20 @@ class OdooDataCleaner:
         print("-" * 70)
         print(f"  {'TOTAL DELETED':.<50} {total_deleted:>4} records")
 
+        if self.failed:
+            print("\n⚠ RECORDS THAT COULD NOT BE DELETED:")
+            print("-" * 70)
+            for model, record_ids in self.failed.items():
+                sample = ', '.join(str(record_id) for record_id in record_ids[:10])
+                more = f" (+{len(record_ids) - 10} more)" if len(record_ids) > 10 else ""
+                print(f"  {model}: {sample}{more}")
+
         print("\n" + "=" * 70)
-        print("✓ Cleanup completed successfully!")
+        if self.failed:
+            failed = sum(len(record_ids) for record_ids in self.failed.values())
+            print(f"❌ Cleanup incomplete: {failed:,} records could not be deleted")
+        else:
+            print("✓ Cleanup completed successfully!")
         print("=" * 70 + "\n")
 
 
@@ -310,6 +539,12 @@ def main():
     parser.add_argument('--password', default=config.ODOO_PASSWORD, help='Password')
     parser.add_argument('--yes', action='store_true', help='Skip confirmation prompt')
     parser.add_argument('--preview', action='store_true', help='Preview only, do not delete')
+    parser.add_argument('--run', metavar='RUN_ID', help='Delete only the records of one generator run')
+    parser.add_argument('--list-runs', action='store_true', help='List generator runs with tagged records')
+    parser.add_argument('--workers', type=int, default=config.BULK_CONFIG['workers'],
+                        help='Parallel XML-RPC connections (1 = sequential)')
+    parser.add_argument('--batch-size', type=int, default=config.BULK_CONFIG['delete_batch_size'],
+                        help='Records per unlink call')
 
     args = parser.parse_args()
 
@@ -317,10 +552,18 @@ def main():
     print("GOTIT CRM - DEMO DATA CLEANUP")
     print("=" * 70 + "\n")
 
+    cleaner = None
     try:
-        cleaner = OdooDataCleaner(args.url, args.db, args.user, args.password)
-
-        if args.preview:
+        cleaner = OdooDataCleaner(args.url, args.db, args.user, args.password,
+                                  workers=args.workers, batch_size=args.batch_size)
+
+        if args.list_runs:
+            cleaner.list_runs()
+        elif args.run:
+            cleaner.clean_run(args.run, skip_confirmation=args.yes, preview=args.preview)
+            if args.preview:
+                print("\n(Preview mode - no data was deleted)")
+        elif args.preview:
             cleaner.show_summary()
             print("\n(Preview mode - no data was deleted)")
         else:
@@ -331,8 +574,11 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        if cleaner is not None:
+            cleaner.close()
 
-    return 0
+    return 1 if cleaner.failed else 0
 
 
 if __name__ == '__main__':
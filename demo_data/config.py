@@ -22,6 +22,67 @@ DATA_VOLUME = {
     'activities': 60,
 }
 
+# Scale Profiles (select with --profile; TEST_SCENARIOS are scaled by customers relative to medium)
+SCALE_PROFILES = {
+    'small': {
+        'sales_teams': 5,
+        'users': 15,
+        'customers': 20,
+        'leads': 20,
+        'opportunities': 15,
+        'products': 20,
+        'quotations': 10,
+        'activities': 20,
+    },
+    'medium': dict(DATA_VOLUME),
+    'large': {
+        'sales_teams': 5,
+        'users': 15,
+        'customers': 20_000,
+        'leads': 15_000,
+        'opportunities': 8_000,
+        'products': 500,
+        'quotations': 8_000,
+        'activities': 15_000,
+    },
+    'xlarge': {
+        'sales_teams': 5,
+        'users': 15,
+        'customers': 1_000_000,
+        'leads': 500_000,
+        'opportunities': 200_000,
+        'products': 5_000,
+        'quotations': 200_000,
+        'activities': 500_000,
+    },
+}
+
+# Bulk/parallel settings used automatically from a customer count upwards
+# (explicit --batch-size / --workers still win)
+LARGE_VOLUME_BULK = {
+    10_000: {'batch_size': 1000, 'workers': 4},
+    250_000: {'batch_size': 2000, 'workers': 8},
+}
+
+# Run Tagging: every generated record gets an external ID in the module
+# '<RUN_XMLID_PREFIX><run id>', so one run can be cleaned up precisely
+RUN_XMLID_PREFIX = 'demo_'
+
+# Synthetic Value Generation (batch generators in vietnam_data.py)
+VALUE_GENERATION = {
+    'unique': True,  # Tax IDs, phones and emails never repeat except in the duplicate test scenarios
+    'batch_size': 10_000,  # Values generated per batch
+}
+
+# Bulk Creation Settings
+BULK_CONFIG = {
+    'batch_size': 200,  # Records per XML-RPC create call (Odoo accepts a list of value dicts)
+    'workers': 1,  # Parallel XML-RPC connections (raise to match Odoo's worker count)
+    'delete_batch_size': 1000,  # Records per unlink call in clean_demo_data.py
+    'delete_retries': 2,  # Retries of an unlink chunk after a connection error before it is split in half
+    'retry_delay': 1.0,  # Seconds before the first retry (grows linearly)
+}
+
 # Test Scenarios Configuration
 TEST_SCENARIOS = {
     # Duplicate Detection Tests
@@ -29,6 +90,7 @@ TEST_SCENARIOS = {
     'duplicate_phones': 5,   # Customers with same phone
     'duplicate_emails': 3,   # Customers with same email
     'duplicate_leads': 10,   # Leads matching existing customers
+    'duplicate_group_size': 5,  # Customers sharing one duplicate value (new value per group)
 
     # Company Group Tests
     'company_groups': 10,    # Parent companies
@@ -112,6 +174,25 @@ SALES_TEAM_REGIONS = {
     'SME Team': None,  # Handles all regions for SME customers
 }
 
+# Lead Assignment Rules (assignment_rules.py), in priority order: the first matching rule wins.
+# A rule lists the accepted values of industry / region / customer_type / order_value;
+# dimensions it leaves out match any value.
+ASSIGNMENT_RULES = [
+    {'name': 'Finance industry', 'industry': ['Finance'], 'team': 'Enterprise Team'},
+    {'name': 'Enterprise customers', 'customer_type': ['Enterprise'], 'team': 'Enterprise Team'},
+    {'name': 'Large orders', 'order_value': ['100M - 500M', '> 500M'], 'team': 'Enterprise Team'},
+    {'name': 'North region', 'region': SALES_TEAM_REGIONS['North Team'], 'team': 'North Team'},
+    {'name': 'South region', 'region': SALES_TEAM_REGIONS['South Team'], 'team': 'South Team'},
+    {'name': 'Central region', 'region': SALES_TEAM_REGIONS['Central Team'], 'team': 'Central Team'},
+    {'name': 'Everything else', 'team': 'SME Team'},
+]
+
+ASSIGNMENT_CONFIG = {
+    'tie_breaking': 'load_balanced',  # 'round_robin' or 'load_balanced' between a team's salespeople
+    'rules_file': os.getenv('ASSIGNMENT_RULES_FILE'),  # JSON rules replacing ASSIGNMENT_RULES (hot-reloadable)
+    'reload_interval': 5.0,  # Seconds between checks of the rules file when watching it
+}
+
 # User Roles Distribution
 USER_ROLES = {
     'telesale': 5,  # 5 telesale users
@@ -153,12 +234,15 @@ QUOTATION_STATUS_DISTRIBUTION = {
     'cancel': 0.10,
 }
 
-# Output Configuration
+# Output Configuration (demo_data/output, whatever the working directory; git-ignored)
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'output')
+
 OUTPUT_CONFIG = {
     'show_progress': True,
     'generate_report': True,
     'export_csv': True,
-    'csv_output_dir': 'demo_data/output',
+    'csv_output_dir': OUTPUT_DIR,
+    'checkpoint_file': os.path.join(OUTPUT_DIR, 'checkpoint.jsonl'),  # Journal for --resume
 }
 
 # Validation Rules
@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+Duplicate Detection for GotIt CRM
+Finds partners and leads sharing a Tax ID (MST), phone or email using
+in-memory hash indexes and union-find clustering, in a single streaming pass
+"""
+
+import argparse
+import csv
+import heapq
+import itertools
+import json
+import os
+import time
+import xmlrpc.client
+from array import array
+from collections import defaultdict
+
+# Import local modules
+import config
+from normalization import BATCH_NORMALIZERS, NORMALIZERS
+from rpc_pool import ProxyPool
+
+
+# Source fields per match key and model
+MATCH_FIELDS = {
+    'res.partner': {
+        'vat': ['vat'],
+        'phone': ['phone', 'mobile'],
+        'email': ['email'],
+    },
+    'crm.lead': {
+        'phone': ['phone', 'mobile'],
+        'email': ['email_from'],
+    },
+}
+
+MATCH_KEYS = ('vat', 'phone', 'email')
+
+# Records read per search_read call
+PAGE_SIZE = 5000
+
+# Print scan progress every N pages
+PROGRESS_INTERVAL = 20
+
+REPORT_FORMATS = ('jsonl', 'csv')
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 (path halving, union by size) stored in compact arrays"""
+
+    def __init__(self):
+        self.parent = array('q')
+        self.size = array('q')
+
+    def __len__(self):
+        return len(self.parent)
+
+    def add(self, count=1):
+        """Add count singleton sets and return the first new item number"""
+        first = len(self.parent)
+        self.parent.extend(range(first, first + count))
+        self.size.extend(itertools.repeat(1, count))
+        return first
+
+    def find(self, item):
+        """Return the representative of an item's set"""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a, b):
+        """Merge the sets of a and b and return the new representative"""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return root_a
+
+
+class DuplicateIndex:
+    """
+    Hash indexes on normalized vat / phone / email with incremental clustering
+
+    Memory stays small per record: record keys live in arrays, indexes are
+    keyed by the normalized value and hold the first record number. Only
+    values shared by several records get a list of record numbers.
+    """
+
+    def __init__(self):
+        # match key -> normalized value -> record number, or [record numbers...]
+        self.indexes = {key: {} for key in MATCH_KEYS}
+        # record number -> model / id
+        self.models = list(MATCH_FIELDS)
+        self.model_codes = array('B')
+        self.ids = array('q')
+        self.sets = UnionFind()
+        self._plans = {
+            model: [(field, key, self.indexes[key])
+                    for key, fields in match_fields.items() for field in fields]
+            for model, match_fields in MATCH_FIELDS.items()
+        }
+
+    def __len__(self):
+        return len(self.ids)
+
+    def key(self, number):
+        """(model, id) of a record number"""
+        return self.models[self.model_codes[number]], self.ids[number]
+
+    def add(self, model, record):
+        """Index a record (dict with 'id' and the MATCH_FIELDS of its model)"""
+        self.add_many(model, [record])
+
+    def add_many(self, model, records):
+        """
+        Index a batch of records of one model
+
+        Works column by column with the batch normalizers; this is the fast
+        path for full scans.
+        """
+        records = records if isinstance(records, list) else list(records)
+        first = self.sets.add(len(records))
+        self.model_codes.extend(itertools.repeat(self.models.index(model), len(records)))
+        self.ids.extend(int(record['id']) for record in records)
+
+        union = self.sets.union
+        for field, key, index in self._plans[model]:
+            values = BATCH_NORMALIZERS[key]([record.get(field) for record in records])
+            for number, value in enumerate(values, first):
+                if not value:
+                    continue
+                bucket = index.get(value)
+                if bucket is None:
+                    index[value] = number
+                elif bucket.__class__ is int:
+                    if bucket != number:
+                        union(bucket, number)
+                        index[value] = [bucket, number]
+                elif bucket[-1] != number:
+                    # Same record seen through another field (phone and mobile) is not a duplicate
+                    union(bucket[0], number)
+                    bucket.append(number)
+
+    def matches(self, model, record):
+        """(model, id) keys already indexed sharing a vat, phone or email with record"""
+        found = set()
+        for field, key, index in self._plans[model]:
+            value = NORMALIZERS[key](record.get(field))
+            bucket = index.get(value) if value else None
+            if bucket is None:
+                continue
+            found.update([bucket] if bucket.__class__ is int else bucket)
+        keys = {self.key(number) for number in found}
+        keys.discard((model, record.get('id')))
+        return keys
+
+    def iter_clusters(self, min_size=2):
+        """
+        Yield duplicate clusters one at a time
+
+        Each cluster is a dict with 'records' (sorted (model, id) keys) and
+        'matched_on' (match key -> shared values). Only records in clusters
+        are grouped, so memory grows with the number of duplicates.
+        """
+        find = self.sets.find
+        size = self.sets.size
+        members = defaultdict(list)
+        for number in range(len(self.ids)):
+            root = find(number)
+            if size[root] >= min_size:
+                members[root].append(number)
+
+        matched_on = defaultdict(lambda: defaultdict(list))
+        for key, index in self.indexes.items():
+            for value, bucket in index.items():
+                if bucket.__class__ is not int and size[find(bucket[0])] >= min_size:
+                    matched_on[find(bucket[0])][key].append(value)
+
+        for root in list(members):
+            numbers = members.pop(root)
+            yield {
+                'records': sorted(self.key(number) for number in numbers),
+                'matched_on': dict(matched_on.pop(root, {})),
+            }
+
+    def clusters(self, min_size=2):
+        """
+        Group duplicate records
+
+        Returns:
+            List of clusters (see iter_clusters), largest first
+        """
+        clusters = list(self.iter_clusters(min_size))
+        clusters.sort(key=lambda cluster: (-len(cluster['records']), cluster['records'][0]))
+        return clusters
+
+
+class ClusterReport:
+    """Write duplicate clusters to a JSONL or CSV file as they are produced"""
+
+    CSV_FIELDS = ['cluster', 'size', 'model', 'id', 'name', 'matched_on']
+
+    def __init__(self, path, output_format='jsonl'):
+        if output_format not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format: {output_format}")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.output_format = output_format
+        self.count = 0
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        if output_format == 'csv':
+            self._writer = csv.DictWriter(self._file, fieldnames=self.CSV_FIELDS)
+            self._writer.writeheader()
+
+    def write(self, cluster, names=None):
+        """Append one cluster; names maps (model, id) to a display name"""
+        self.count += 1
+        names = names or {}
+        records = [{'model': model, 'id': record_id, 'name': names.get((model, record_id), '')}
+                   for model, record_id in cluster['records']]
+
+        if self.output_format == 'jsonl':
+            self._file.write(json.dumps({
+                'cluster': self.count,
+                'size': len(records),
+                'matched_on': cluster['matched_on'],
+                'records': records,
+            }, ensure_ascii=False) + '\n')
+        else:
+            matched_on = '; '.join(f"{key}={value}" for key, values in cluster['matched_on'].items()
+                                   for value in values)
+            for record in records:
+                self._writer.writerow(dict(record, cluster=self.count, size=len(records),
+                                           matched_on=matched_on))
+
+    def close(self):
+        """Close the report file"""
+        self._file.close()
+
+
+class DuplicateScanner:
+    """Stream partners and leads from Odoo into a DuplicateIndex"""
+
+    def __init__(self, url, db, username, password, page_size=None):
+        """Initialize connection to Odoo"""
+        self.url = url
+        self.db = db
+        self.username = username
+        self.password = password
+        self.page_size = page_size or PAGE_SIZE
+
+        print(f"Connecting to Odoo at {url}...")
+        self.common = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/common')
+        self.uid = self.common.authenticate(db, username, password, {})
+
+        if not self.uid:
+            raise Exception("Authentication failed!")
+
+        self._object_proxies = ProxyPool(f'{url}/xmlrpc/2/object')
+        print(f"✓ Connected as user ID: {self.uid}\n")
+
+        self.index = DuplicateIndex()
+
+    def execute(self, model, method, args_list, kwargs_dict=None):
+        """Execute a method on an Odoo model"""
+        if kwargs_dict is None:
+            kwargs_dict = {}
+        return self._object_proxies.get().execute_kw(
+            self.db, self.uid, self.password,
+            model, method, args_list, kwargs_dict
+        )
+
+    def iter_pages(self, model, fields):
+        """
+        Yield all records of a model in pages of page_size
+
+        Uses keyset pagination (id > last seen id), so every page is an
+        index range scan instead of an OFFSET that rereads skipped rows.
+        """
+        last_id = 0
+        while True:
+            page = self.execute(model, 'search_read', [[('id', '>', last_id)]], {
+                'fields': fields, 'order': 'id', 'limit': self.page_size,
+            })
+            if not page:
+                return
+            yield page
+            last_id = page[-1]['id']
+            if len(page) < self.page_size:
+                return
+
+    def scan(self, models):
+        """Index every record of the given models, page by page"""
+        for model in models:
+            fields = [field for fields in MATCH_FIELDS[model].values() for field in fields]
+            started = time.time()
+            count = 0
+
+            for page in self.iter_pages(model, fields):
+                self.index.add_many(model, page)
+                count += len(page)
+                self.progress(model, count, started)
+
+            print(f"  → Indexed {count:,} {model} records in {time.time() - started:.1f}s")
+
+        return self.index
+
+    def progress(self, model, count, started):
+        """Print scan progress every PROGRESS_INTERVAL pages"""
+        if count % (self.page_size * PROGRESS_INTERVAL) == 0:
+            rate = count / max(time.time() - started, 1e-6)
+            print(f"    {model}: {count:,} records ({rate:,.0f}/s)")
+
+    def read_names(self, record_keys):
+        """Display names of records, read in chunks of page_size"""
+        by_model = defaultdict(list)
+        for model, record_id in record_keys:
+            by_model[model].append(record_id)
+
+        names = {}
+        for model, record_ids in by_model.items():
+            for start in range(0, len(record_ids), self.page_size):
+                for record in self.execute(model, 'read', [record_ids[start:start + self.page_size]],
+                                           {'fields': ['name']}):
+                    names[(model, record['id'])] = record['name']
+        return names
+
+
+def scan_csv(index, input_dir, models):
+    """Index the model CSV files written by offline mode (see offline_dataset.py)"""
+    for model in models:
+        path = os.path.join(input_dir, f"{model}.csv")
+        if not os.path.exists(path):
+            print(f"  ⚠ {path} not found, skipping {model}")
+            continue
+
+        started = time.time()
+        count = 0
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            while True:
+                page = list(itertools.islice(reader, PAGE_SIZE))
+                index.add_many(model, page)
+                count += len(page)
+                if len(page) < PAGE_SIZE:
+                    break
+        print(f"  → Indexed {count:,} {model} records in {time.time() - started:.1f}s")
+
+    return index
+
+
+def write_report(index, report, min_size=2, read_names=None, limit=20):
+    """
+    Stream clusters to a report, resolving names a page of records at a time
+
+    Returns:
+        Dict with cluster statistics and the `limit` largest clusters
+    """
+    summary = {'clusters': 0, 'records': 0, 'by_key': dict.fromkeys(MATCH_KEYS, 0), 'largest': []}
+
+    def flush(batch):
+        names = read_names([key for cluster in batch for key in cluster['records']]) if read_names else {}
+        for cluster in batch:
+            report.write(cluster, names)
+
+    batch = []
+    batch_records = 0
+    for cluster in index.iter_clusters(min_size):
+        summary['clusters'] += 1
+        summary['records'] += len(cluster['records'])
+        for key in cluster['matched_on']:
+            summary['by_key'][key] += 1
+
+        entry = (len(cluster['records']), -summary['clusters'], cluster)
+        if len(summary['largest']) < limit:
+            heapq.heappush(summary['largest'], entry)
+        elif entry[:2] > summary['largest'][0][:2]:
+            heapq.heapreplace(summary['largest'], entry)
+
+        if report is not None:
+            batch.append(cluster)
+            batch_records += len(cluster['records'])
+            if batch_records >= PAGE_SIZE:
+                flush(batch)
+                batch, batch_records = [], 0
+
+    if report is not None and batch:
+        flush(batch)
+
+    summary['largest'] = [cluster for _, _, cluster in sorted(summary['largest'], reverse=True)]
+    return summary
+
+
+def print_report(summary, total):
+    """Print a duplicate cluster summary"""
+    print("\n" + "=" * 70)
+    print("DUPLICATE DETECTION REPORT")
+    print("=" * 70)
+
+    print(f"\n  Records scanned............................... {total:>9,}")
+    print(f"  Duplicate clusters............................ {summary['clusters']:>9,}")
+    print(f"  Records in clusters........................... {summary['records']:>9,}")
+
+    for key in MATCH_KEYS:
+        print(f"  Clusters sharing {key:.<29} {summary['by_key'][key]:>9,}")
+
+    largest = summary['largest']
+    if largest:
+        print(f"\n📋 LARGEST CLUSTERS (top {len(largest)}):")
+        print("-" * 70)
+        for cluster in largest:
+            shared = ', '.join(f"{key}={values[0]}" for key, values in cluster['matched_on'].items())
+            records = ', '.join(f"{model}:{record_id}" for model, record_id in cluster['records'][:5])
+            more = ' ...' if len(cluster['records']) > 5 else ''
+            print(f"  {len(cluster['records']):>4} records | {shared}")
+            print(f"       {records}{more}")
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Find duplicate partners and leads in GotIt CRM')
+    parser.add_argument('--url', default=config.ODOO_URL, help='Odoo URL')
+    parser.add_argument('--db', default=config.ODOO_DB, help='Database name')
+    parser.add_argument('--user', default=config.ODOO_USERNAME, help='Username')
+    parser.add_argument('--password', default=config.ODOO_PASSWORD, help='Password')
+    parser.add_argument('--models', nargs='+', choices=list(MATCH_FIELDS), default=list(MATCH_FIELDS),
+                        help='Models to scan')
+    parser.add_argument('--input-dir',
+                        help='Scan the CSV files of an offline run instead of connecting to Odoo')
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE,
+                        help=f'Records per search_read call (default {PAGE_SIZE})')
+    parser.add_argument('--min-size', type=int, default=2, help='Smallest cluster to report')
+    parser.add_argument('--output', help='Write clusters to this report file')
+    parser.add_argument('--format', choices=REPORT_FORMATS, default='jsonl',
+                        help='Report format (default jsonl)')
+
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("GOTIT CRM - DUPLICATE DETECTION")
+    print("=" * 70 + "\n")
+
+    report = None
+    try:
+        started = time.time()
+        read_names = None
+        if args.input_dir:
+            index = scan_csv(DuplicateIndex(), args.input_dir, args.models)
+        else:
+            scanner = DuplicateScanner(args.url, args.db, args.user, args.password, page_size=args.page_size)
+            index = scanner.scan(args.models)
+            read_names = scanner.read_names
+
+        if args.output:
+            report = ClusterReport(args.output, args.format)
+        summary = write_report(index, report, min_size=args.min_size, read_names=read_names)
+        print(f"  → Clustered in {time.time() - started:.1f}s total")
+
+        print_report(summary, len(index))
+        if report is not None:
+            print(f"\n✓ {report.count:,} clusters written to {args.output}")
+
+    except Exception as e:
+        print(f"\n❌ Error: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    finally:
+        if report is not None:
+            report.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
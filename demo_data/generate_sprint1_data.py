@@ -7,20 +7,64 @@ Generates realistic Vietnamese business data for testing Sprint 1 requirements
 import xmlrpc.client
 import random
 import argparse
+import itertools
+import threading
 from datetime import datetime, timedelta
 from collections import defaultdict
 import json
 import os
+import re
 
 # Import local modules
 import config
 import vietnam_data as vn
+from checkpoint import CheckpointJournal
+from rpc_pool import ProxyPool, WorkerPool, run_concurrently
+
+
+# Test scenario counts that grow with the profile size
+SCALED_SCENARIOS = (
+    'duplicate_tax_ids', 'duplicate_phones', 'duplicate_emails', 'duplicate_leads',
+    'company_groups', 'customers_with_multiple_addresses', 'customers_with_multiple_invoices',
+    'unassigned_leads',
+)
+# Scenarios that give customers a shared value: one customer duplicates nothing
+DUPLICATE_SCENARIOS = ('duplicate_tax_ids', 'duplicate_phones', 'duplicate_emails')
+BASE_TEST_SCENARIOS = dict(config.TEST_SCENARIOS)
+BASE_CUSTOMERS = config.SCALE_PROFILES['medium']['customers']
+
+
+def apply_profile(name):
+    """
+    Switch config to a named scale profile
+
+    Replaces DATA_VOLUME, scales TEST_SCENARIOS proportionally to the customer
+    count and, for large volumes, returns the bulk/parallel settings to use.
+
+    Returns:
+        Dict with 'batch_size' and 'workers' (empty for small volumes)
+    """
+    volume = config.SCALE_PROFILES[name]
+    config.DATA_VOLUME.clear()
+    config.DATA_VOLUME.update(volume)
+
+    factor = volume['customers'] / BASE_CUSTOMERS
+    for key in SCALED_SCENARIOS:
+        minimum = 2 if key in DUPLICATE_SCENARIOS else 1
+        config.TEST_SCENARIOS[key] = max(minimum, round(BASE_TEST_SCENARIOS[key] * factor))
+
+    bulk = {}
+    for threshold, settings in sorted(config.LARGE_VOLUME_BULK.items()):
+        if volume['customers'] >= threshold:
+            bulk = settings
+    return dict(bulk)
 
 
 class OdooDataGenerator:
     """Main class for generating demo data in Odoo"""
 
-    def __init__(self, url, db, username, password):
+    def __init__(self, url, db, username, password, batch_size=None, workers=None, journal=None,
+                 run_id=None):
         """Initialize connection to Odoo"""
         self.url = url
         self.db = db
@@ -34,29 +78,157 @@ class OdooDataGenerator:
         if not self.uid:
             raise Exception("Authentication failed!")
 
-        self.models = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object')
+        # One object proxy per worker thread (ServerProxy is not thread-safe)
+        self._object_proxies = ProxyPool(f'{url}/xmlrpc/2/object')
+        self.models = self._object_proxies.get()
         print(f"✓ Connected as user ID: {self.uid}\n")
 
+        self._init_state(batch_size=batch_size, workers=workers, journal=journal, run_id=run_id)
+
+    def _init_state(self, batch_size=None, workers=None, journal=None, run_id=None):
+        """Initialize record storage, bulk buffers and worker settings"""
         # Storage for created records
         self.created = defaultdict(list)
         self.stats = defaultdict(int)
 
+        # Bulk-create buffers: records are sent to Odoo in chunks of batch_size
+        self.batch_size = max(1, batch_size or config.BULK_CONFIG['batch_size'])
+        self._pending = defaultdict(list)
+        self._flushed_ids = defaultdict(list)
+
+        # Parallel mode: chunks are sent by one pool of worker threads for the whole run
+        self.workers = max(1, workers or config.BULK_CONFIG['workers'])
+        self.pool = WorkerPool(self.workers)
+        self._lock = threading.Lock()
+
+        # Reference records (countries, stages, ...) read once per run
+        self.reference = None
+
+        # Checkpoint journal: completed chunks are skipped when a run is resumed
+        self.journal = journal
+        self._chunk_counters = defaultdict(itertools.count)
+
+        # Run tagging: external IDs in the module demo_<run_id>
+        self.run_id = run_id
+        self.run_module = f"{config.RUN_XMLID_PREFIX}{run_id}" if run_id else None
+
+        # Synthetic values come from batch generators; tax IDs, phones and
+        # emails never repeat unless a test scenario duplicates them on purpose
+        unique = config.VALUE_GENERATION['unique']
+        value_batch = config.VALUE_GENERATION['batch_size']
+        self._tax_ids = vn.ValueStream(vn.generate_tax_ids, value_batch, unique=unique)
+        self._phones = vn.ValueStream(vn.generate_phones, value_batch, unique=unique)
+        self._person_names = vn.ValueStream(vn.generate_person_names, value_batch)
+        self._company_names = vn.ValueStream(vn.generate_company_names, value_batch)
+        self._email_counts = {} if unique else None
+
     def execute(self, model, method, args_list, kwargs_dict=None):
         """Execute a method on an Odoo model"""
         if kwargs_dict is None:
             kwargs_dict = {}
-        return self.models.execute_kw(
+        return self._object_proxies.get().execute_kw(
             self.db, self.uid, self.password,
             model, method, args_list, kwargs_dict
         )
 
     def create_record(self, model, values):
         """Create a single record and return its ID"""
+        # Not tagged: single creates are stages, which later runs reuse
         record_id = self.execute(model, 'create', [values])
-        self.created[model].append(record_id)
-        self.stats[f'{model}_created'] += 1
+        with self._lock:
+            self.created[model].append(record_id)
+            self.stats[f'{model}_created'] += 1
         return record_id
 
+    def create_records(self, model, values_list):
+        """Create records with one create call per chunk and return their IDs in order"""
+        chunks = [values_list[start:start + self.batch_size]
+                  for start in range(0, len(values_list), self.batch_size)]
+        results = self._run_chunks(model, 'create', chunks,
+                                   lambda chunk: self.execute(model, 'create', [chunk]), tag=True)
+        record_ids = [record_id for chunk_ids in results for record_id in chunk_ids]
+
+        with self._lock:
+            self.created[model].extend(record_ids)
+            self.stats[f'{model}_created'] += len(record_ids)
+        return record_ids
+
+    def _tag_records(self, model, record_ids, replay=False):
+        """
+        Give created records an external ID in the run's module (one create call)
+
+        A replayed chunk may have been tagged just before the interruption,
+        so its existing external IDs are looked up first.
+        """
+        if not self.run_module or not record_ids:
+            return
+        if replay:
+            tagged = self.execute('ir.model.data', 'search_read', [[
+                ('module', '=', self.run_module), ('model', '=', model), ('res_id', 'in', record_ids),
+            ]], {'fields': ['res_id']})
+            tagged_ids = {entry['res_id'] for entry in tagged}
+            record_ids = [record_id for record_id in record_ids if record_id not in tagged_ids]
+            if not record_ids:
+                return
+        prefix = model.replace('.', '_')
+        self.execute('ir.model.data', 'create', [[{
+            'module': self.run_module,
+            'name': f"{prefix}_{record_id}",
+            'model': model,
+            'res_id': record_id,
+            'noupdate': True,
+        } for record_id in record_ids]])
+
+    def _run_chunks(self, model, method, chunks, call, tag=False):
+        """Run call(chunk) for every chunk on the worker pool, skipping chunks already journaled"""
+        counter = self._chunk_counters[(model, method)]
+        keyed = [(f"{model}:{method}:{next(counter)}", chunk) for chunk in chunks]
+        return self.pool.map(lambda item: self._run_chunk(model, *item, call, tag), keyed)
+
+    def _run_chunk(self, model, key, chunk, call, tag=False):
+        """
+        Run one chunk, or return its IDs from the checkpoint journal
+
+        Created IDs are journaled before the records are tagged, so a crash in
+        between leaves no records the journal does not know about: the replay
+        tags the journaled chunk instead of creating it again.
+        """
+        record_ids = self.journal.chunk(key) if self.journal is not None else None
+        replay = record_ids is not None
+        if replay:
+            with self._lock:
+                self.stats['chunks_resumed'] += 1
+        else:
+            result = call(chunk)
+            # Writes return True; journal the IDs they were applied to
+            record_ids = result if isinstance(result, list) else chunk
+            if self.journal is not None:
+                self.journal.record_chunk(key, record_ids)
+
+        if tag and not (self.journal is not None and self.journal.chunk_tagged(key)):
+            self._tag_records(model, record_ids, replay=replay)
+            if self.journal is not None:
+                self.journal.record_tagged(key)
+        return record_ids
+
+    def buffer_record(self, model, values):
+        """Queue a record for bulk creation, sending one chunk per worker when the buffer is full"""
+        self._pending[model].append(values)
+        if len(self._pending[model]) >= self.batch_size * self.workers:
+            self._flush_pending(model)
+
+    def flush(self, model):
+        """Create all buffered records of a model and return IDs created since the last flush"""
+        self._flush_pending(model)
+        record_ids = self._flushed_ids.pop(model, [])
+        return record_ids
+
+    def _flush_pending(self, model):
+        """Send the pending buffer of a model to Odoo"""
+        pending = self._pending.pop(model, [])
+        if pending:
+            self._flushed_ids[model].extend(self.create_records(model, pending))
+
     def search_records(self, model, domain, limit=None):
         """Search for records"""
         kwargs_dict = {}
@@ -64,6 +236,28 @@ class OdooDataGenerator:
             kwargs_dict['limit'] = limit
         return self.execute(model, 'search', [domain], kwargs_dict)
 
+    def load_reference_data(self):
+        """Read reference records with one search_read per model and cache them by name"""
+        countries = self.execute('res.country', 'search_read', [[]], {'fields': ['name']})
+        stages = self.execute('crm.stage', 'search_read', [[]], {'fields': ['name']})
+        activity_types = self.execute('mail.activity.type', 'search_read', [[]], {'fields': ['name']})
+        ir_models = self.execute('ir.model', 'search_read', [[('model', 'in', ['crm.lead'])]],
+                                 {'fields': ['model']})
+
+        self.reference = {
+            'res.country': {country['name']: country['id'] for country in countries},
+            # Keep the first match like search(limit=1) did
+            'crm.stage': {},
+            'mail.activity.type': [activity_type['id'] for activity_type in activity_types],
+            'ir.model': {ir_model['model']: ir_model['id'] for ir_model in ir_models},
+        }
+        for stage in stages:
+            self.reference['crm.stage'].setdefault(stage['name'], stage['id'])
+
+        self.progress(f"Loaded reference data: {len(countries)} countries, {len(stages)} stages, "
+                      f"{len(activity_types)} activity types")
+        return self.reference
+
     def progress(self, message):
         """Print progress message"""
         if config.OUTPUT_CONFIG['show_progress']:
@@ -76,13 +270,14 @@ class OdooDataGenerator:
         print("Creating Sales Teams...")
 
         for team_name, regions in config.SALES_TEAM_REGIONS.items():
-            team_id = self.create_record('crm.team', {
+            self.buffer_record('crm.team', {
                 'name': team_name,
                 'use_leads': True,
                 'use_opportunities': True,
             })
             self.progress(f"Created team: {team_name}")
 
+        self.flush('crm.team')
         return self.created['crm.team']
 
     def create_users(self):
@@ -104,7 +299,6 @@ class OdooDataGenerator:
         """Create customer records with various test scenarios"""
         print("\nCreating Customers...")
 
-        customers = []
         user_ids = self.created['res.users']
 
         # Regular customers
@@ -115,48 +309,55 @@ class OdooDataGenerator:
                        (config.TEST_SCENARIOS['company_groups'] * 2)  # Parent + 1 subsidiary on avg
 
         for i in range(regular_count):
-            customer = self._create_customer(user_ids)
-            customers.append(customer)
+            self.buffer_record('res.partner', self._customer_vals(user_ids))
 
         # Duplicate Tax ID test cases
         self.progress("Creating duplicate Tax ID test cases...")
-        duplicate_tax_id = vn.generate_tax_id()
-        for i in range(config.TEST_SCENARIOS['duplicate_tax_ids']):
-            customer = self._create_customer(user_ids, tax_id=duplicate_tax_id)
-            customers.append(customer)
+        for duplicate_tax_id in self._duplicate_values('duplicate_tax_ids', self._tax_ids.__next__):
+            self.buffer_record('res.partner', self._customer_vals(user_ids, tax_id=duplicate_tax_id))
 
         # Duplicate phone test cases
         self.progress("Creating duplicate phone test cases...")
-        duplicate_phone = vn.generate_phone()
-        for i in range(config.TEST_SCENARIOS['duplicate_phones']):
-            customer = self._create_customer(user_ids, phone=duplicate_phone)
-            customers.append(customer)
+        for duplicate_phone in self._duplicate_values('duplicate_phones', self._phones.__next__):
+            self.buffer_record('res.partner', self._customer_vals(user_ids, phone=duplicate_phone))
 
         # Duplicate email test cases
         self.progress("Creating duplicate email test cases...")
-        duplicate_email = "duplicate.test@company.vn"
-        for i in range(config.TEST_SCENARIOS['duplicate_emails']):
-            customer = self._create_customer(user_ids, email=duplicate_email)
-            customers.append(customer)
+        groups = itertools.count()
+        make_email = lambda: f"duplicate.test{next(groups) or ''}@company.vn"
+        for duplicate_email in self._duplicate_values('duplicate_emails', make_email):
+            self.buffer_record('res.partner', self._customer_vals(user_ids, email=duplicate_email))
+
+        customers = self.flush('res.partner')
 
         # Company groups (parent + subsidiaries)
         self.progress("Creating company groups...")
         for i in range(config.TEST_SCENARIOS['company_groups']):
-            parent = self._create_customer(user_ids, is_company=True)
-            customers.append(parent)
+            self.buffer_record('res.partner', self._customer_vals(user_ids, is_company=True))
+        parents = self.flush('res.partner')
 
-            # Create subsidiaries
+        # Create subsidiaries once their parents have IDs
+        for parent in parents:
             num_subsidiaries = random.randint(*config.TEST_SCENARIOS['subsidiaries_per_group'])
             for j in range(num_subsidiaries):
-                subsidiary = self._create_customer(user_ids, parent_id=parent, is_company=True)
-                customers.append(subsidiary)
-
-        return customers
-
-    def _create_customer(self, user_ids, tax_id=None, phone=None, email=None, parent_id=None, is_company=True):
-        """Create a single customer record"""
-        company_name = vn.generate_company_name()
-        contact_name = vn.generate_person_name()
+                self.buffer_record('res.partner', self._customer_vals(user_ids, parent_id=parent, is_company=True))
+        subsidiaries = self.flush('res.partner')
+
+        return customers + parents + subsidiaries
+
+    def _duplicate_values(self, scenario, make_value):
+        """Yield one value per duplicate customer, starting a new value every duplicate_group_size"""
+        group_size = max(1, config.TEST_SCENARIOS['duplicate_group_size'])
+        value = None
+        for i in range(config.TEST_SCENARIOS[scenario]):
+            if i % group_size == 0:
+                value = make_value()
+            yield value
+
+    def _customer_vals(self, user_ids, tax_id=None, phone=None, email=None, parent_id=None, is_company=True):
+        """Build the values of a single customer record"""
+        company_name = next(self._company_names)
+        contact_name = next(self._person_names)
         region = self._weighted_random(config.REGION_DISTRIBUTION)
         industry = self._weighted_random(config.INDUSTRY_DISTRIBUTION)
         customer_type = self._weighted_random(config.CUSTOMER_TYPE_DISTRIBUTION)
@@ -166,11 +367,11 @@ class OdooDataGenerator:
 
         # Generate unique values if not provided
         if not tax_id:
-            tax_id = vn.generate_tax_id()
+            tax_id = next(self._tax_ids)
         if not phone:
-            phone = vn.generate_phone()
+            phone = next(self._phones)
         if not email:
-            email = vn.generate_email(contact_name, company_name)
+            email = self._new_email(contact_name, company_name)
 
         # Determine salesperson
         user_id = random.choice(user_ids) if user_ids else False
@@ -200,13 +401,19 @@ class OdooDataGenerator:
         if parent_id:
             vals['parent_id'] = parent_id
 
-        customer_id = self.create_record('res.partner', vals)
-        return customer_id
+        return vals
+
+    def _new_email(self, contact_name, company_name):
+        """Generate an email, numbered if it was already handed out"""
+        email = vn.generate_email(contact_name, company_name)
+        if self._email_counts is None:
+            return email
+        with self._lock:
+            return vn.make_unique_email(email, self._email_counts)
 
     def _get_country_id(self, country_name):
         """Get country ID by name"""
-        country_ids = self.search_records('res.country', [('name', '=', country_name)], limit=1)
-        return country_ids[0] if country_ids else False
+        return self.reference['res.country'].get(country_name, False)
 
     # ==================== Leads ====================
 
@@ -214,7 +421,6 @@ class OdooDataGenerator:
         """Create lead records"""
         print("\nCreating Leads...")
 
-        leads = []
         user_ids = self.created['res.users']
         customers = self.created['res.partner']
 
@@ -224,41 +430,43 @@ class OdooDataGenerator:
                        config.TEST_SCENARIOS['unassigned_leads']
 
         for i in range(regular_count):
-            lead = self._create_lead(user_ids)
-            leads.append(lead)
+            self.buffer_record('crm.lead', self._lead_vals(user_ids))
 
-        # Duplicate leads (matching existing customers)
+        # Duplicate leads (matching existing customers), read in one call
         self.progress("Creating duplicate lead test cases...")
-        for i in range(min(config.TEST_SCENARIOS['duplicate_leads'], len(customers))):
-            customer_id = customers[i]
-            customer = self.execute('res.partner', 'read', [[customer_id]], {'fields': ['name', 'phone', 'email']})[0]
-
-            lead = self._create_lead(user_ids, partner_name=customer['name'],
-                                    phone=customer['phone'], email=customer['email'])
-            leads.append(lead)
+        duplicate_count = min(config.TEST_SCENARIOS['duplicate_leads'], len(customers))
+        if duplicate_count:
+            chunks = [customers[start:min(start + self.batch_size, duplicate_count)]
+                      for start in range(0, duplicate_count, self.batch_size)]
+            results = self.pool.map(
+                lambda chunk: self.execute('res.partner', 'read', [chunk], {'fields': ['name', 'phone', 'email']}),
+                chunks)
+            for customer in (customer for matched in results for customer in matched):
+                self.buffer_record('crm.lead', self._lead_vals(
+                    user_ids, partner_name=customer['name'],
+                    phone=customer['phone'], email=customer['email']))
 
         # Unassigned leads (for auto-assignment testing)
         self.progress("Creating unassigned leads...")
         for i in range(config.TEST_SCENARIOS['unassigned_leads']):
-            lead = self._create_lead(user_ids, assigned=False)
-            leads.append(lead)
+            self.buffer_record('crm.lead', self._lead_vals(user_ids, assigned=False))
 
-        return leads
+        return self.flush('crm.lead')
 
-    def _create_lead(self, user_ids, partner_name=None, phone=None, email=None, assigned=True):
-        """Create a single lead record"""
+    def _lead_vals(self, user_ids, partner_name=None, phone=None, email=None, assigned=True):
+        """Build the values of a single lead record"""
         if not partner_name:
-            partner_name = vn.generate_company_name()
+            partner_name = next(self._company_names)
 
-        contact_name = vn.generate_person_name()
+        contact_name = next(self._person_names)
         region = self._weighted_random(config.REGION_DISTRIBUTION)
         industry = self._weighted_random(config.INDUSTRY_DISTRIBUTION)
         address = vn.generate_address(region)
 
         if not phone:
-            phone = vn.generate_phone()
+            phone = next(self._phones)
         if not email:
-            email = vn.generate_email(contact_name, partner_name)
+            email = self._new_email(contact_name, partner_name)
 
         # Determine stage
         stage = self._weighted_random(config.LEAD_STAGE_DISTRIBUTION)
@@ -283,14 +491,13 @@ class OdooDataGenerator:
         if assigned and user_ids:
             vals['user_id'] = random.choice(user_ids)
 
-        lead_id = self.create_record('crm.lead', vals)
-        return lead_id
+        return vals
 
     def _get_or_create_stage(self, stage_name):
         """Get or create CRM stage"""
-        stage_ids = self.search_records('crm.stage', [('name', '=', stage_name)], limit=1)
-        if stage_ids:
-            return stage_ids[0]
+        stages = self.reference['crm.stage']
+        if stage_name in stages:
+            return stages[stage_name]
 
         # Find stage config
         stage_config = next((s for s in vn.CRM_STAGES if s['name'] == stage_name), None)
@@ -298,6 +505,7 @@ class OdooDataGenerator:
             stage_config = {'name': stage_name, 'sequence': 10}
 
         stage_id = self.create_record('crm.stage', stage_config)
+        stages[stage_name] = stage_id
         return stage_id
 
     # ==================== Opportunities ====================
@@ -306,31 +514,30 @@ class OdooDataGenerator:
         """Create opportunity records"""
         print("\nCreating Opportunities...")
 
-        opportunities = []
         customers = self.created['res.partner']
         user_ids = self.created['res.users']
         leads = self.created['crm.lead']
 
         # Convert some leads to opportunities
         leads_to_convert = min(config.DATA_VOLUME['opportunities'] // 2, len(leads))
+        opportunities = leads[:leads_to_convert]
 
-        for i in range(leads_to_convert):
-            lead_id = leads[i]
-            # Convert lead type to opportunity
-            self.execute('crm.lead', 'write', [[lead_id], {'type': 'opportunity'}])
-            opportunities.append(lead_id)
+        # Convert lead type to opportunity, one write per chunk
+        chunks = [opportunities[start:start + self.batch_size]
+                  for start in range(0, len(opportunities), self.batch_size)]
+        self._run_chunks('crm.lead', 'write', chunks,
+                         lambda chunk: self.execute('crm.lead', 'write', [chunk, {'type': 'opportunity'}]))
 
         # Create new opportunities directly
         remaining = config.DATA_VOLUME['opportunities'] - leads_to_convert
 
         for i in range(remaining):
-            opp = self._create_opportunity(customers, user_ids)
-            opportunities.append(opp)
+            self.buffer_record('crm.lead', self._opportunity_vals(customers, user_ids))
 
-        return opportunities
+        return opportunities + self.flush('crm.lead')
 
-    def _create_opportunity(self, customers, user_ids):
-        """Create a single opportunity record"""
+    def _opportunity_vals(self, customers, user_ids):
+        """Build the values of a single opportunity record"""
         partner_id = random.choice(customers) if customers else False
         user_id = random.choice(user_ids) if user_ids else False
 
@@ -342,7 +549,7 @@ class OdooDataGenerator:
         expected_revenue = random.randint(order_range['min'], order_range['max']) * 1_000_000
 
         vals = {
-            'name': f"Opportunity - {vn.generate_company_name()}",
+            'name': f"Opportunity - {next(self._company_names)}",
             'type': 'opportunity',
             'partner_id': partner_id,
             'user_id': user_id,
@@ -352,8 +559,7 @@ class OdooDataGenerator:
             'priority': str(random.randint(0, 3)),
         }
 
-        opp_id = self.create_record('crm.lead', vals)
-        return opp_id
+        return vals
 
     # ==================== Products ====================
 
@@ -361,8 +567,6 @@ class OdooDataGenerator:
         """Create product records"""
         print("\nCreating Products...")
 
-        products = []
-
         for category, weight in config.PRODUCT_DISTRIBUTION.items():
             count = int(config.DATA_VOLUME['products'] * weight)
 
@@ -370,8 +574,9 @@ class OdooDataGenerator:
             product_list = category_data['products']
 
             for i in range(count):
-                product = self._create_product(category, product_list)
-                products.append(product)
+                self.buffer_record('product.product', self._product_vals(category, product_list))
+
+        products = self.flush('product.product')
 
         # Create products with multiple prices
         self.progress("Creating products with tiered pricing...")
@@ -382,8 +587,8 @@ class OdooDataGenerator:
 
         return products
 
-    def _create_product(self, category, product_list):
-        """Create a single product"""
+    def _product_vals(self, category, product_list):
+        """Build the values of a single product"""
         product_name = random.choice(product_list)
         price_range = config.PRICE_RANGES[category]
         list_price = random.randint(price_range[0], price_range[1])
@@ -398,8 +603,7 @@ class OdooDataGenerator:
             'description_sale': f"{product_name} - {vn.PRODUCT_CATEGORIES[category]['name']}",
         }
 
-        product_id = self.create_record('product.product', vals)
-        return product_id
+        return vals
 
     def _add_price_tiers(self, product_id):
         """Add tiered pricing to a product (simplified version)"""
@@ -413,7 +617,6 @@ class OdooDataGenerator:
         """Create quotation/sales order records"""
         print("\nCreating Quotations...")
 
-        quotations = []
         customers = self.created['res.partner']
         products = self.created['product.product']
         opportunities = self.created['crm.lead']
@@ -421,16 +624,22 @@ class OdooDataGenerator:
 
         if not customers or not products:
             self.progress("Skipping quotations - no customers or products")
-            return quotations
+            return []
 
         for i in range(config.DATA_VOLUME['quotations']):
-            quotation = self._create_quotation(customers, products, opportunities, user_ids)
-            quotations.append(quotation)
+            self.buffer_record('sale.order', self._quotation_vals(customers, opportunities, user_ids))
+        quotations = self.flush('sale.order')
+
+        # Add order lines once the orders have IDs
+        for quotation_id in quotations:
+            for line_vals in self._order_line_vals(quotation_id, products):
+                self.buffer_record('sale.order.line', line_vals)
+        self.flush('sale.order.line')
 
         return quotations
 
-    def _create_quotation(self, customers, products, opportunities, user_ids):
-        """Create a single quotation"""
+    def _quotation_vals(self, customers, opportunities, user_ids):
+        """Build the values of a single quotation"""
         partner_id = random.choice(customers)
         user_id = random.choice(user_ids) if user_ids else False
         opportunity_id = random.choice(opportunities) if opportunities and random.random() < 0.6 else False
@@ -444,23 +653,23 @@ class OdooDataGenerator:
             'state': state,
         }
 
-        quotation_id = self.create_record('sale.order', vals)
+        return vals
 
-        # Add order lines
+    def _order_line_vals(self, quotation_id, products):
+        """Build the values of 1-5 order lines for a quotation"""
+        lines = []
         num_lines = random.randint(1, 5)
         for i in range(num_lines):
             product_id = random.choice(products)
             quantity = random.randint(1, 10)
 
-            line_vals = {
+            lines.append({
                 'order_id': quotation_id,
                 'product_id': product_id,
                 'product_uom_qty': quantity,
-            }
-
-            self.create_record('sale.order.line', line_vals)
+            })
 
-        return quotation_id
+        return lines
 
     # ==================== Activities ====================
 
@@ -468,23 +677,22 @@ class OdooDataGenerator:
         """Create activity records"""
         print("\nCreating Activities...")
 
-        activities = []
         user_ids = self.created['res.users']
         leads = self.created['crm.lead']
 
         if not leads:
             self.progress("Skipping activities - no leads/opportunities")
-            return activities
+            return []
 
         for i in range(config.DATA_VOLUME['activities']):
-            activity = self._create_activity(user_ids, leads)
-            if activity:
-                activities.append(activity)
+            vals = self._activity_vals(user_ids, leads)
+            if vals:
+                self.buffer_record('mail.activity', vals)
 
-        return activities
+        return self.flush('mail.activity')
 
-    def _create_activity(self, user_ids, leads):
-        """Create a single activity"""
+    def _activity_vals(self, user_ids, leads):
+        """Build the values of a single activity"""
         res_id = random.choice(leads)
         user_id = random.choice(user_ids) if user_ids else False
         activity_type = random.choice(vn.ACTIVITY_TYPES)
@@ -499,12 +707,11 @@ class OdooDataGenerator:
             date_deadline = datetime.now() + timedelta(days=random.randint(1, 30))
 
         # Get default activity type
-        activity_type_ids = self.search_records('mail.activity.type', [], limit=1)
+        activity_type_ids = self.reference['mail.activity.type']
         activity_type_id = activity_type_ids[0] if activity_type_ids else False
 
         # Get the model ID for crm.lead
-        model_ids = self.search_records('ir.model', [('model', '=', 'crm.lead')], limit=1)
-        res_model_id = model_ids[0] if model_ids else False
+        res_model_id = self.reference['ir.model'].get('crm.lead', False)
 
         if not res_model_id:
             self.progress("⚠ Could not find model ID for crm.lead, skipping activity")
@@ -519,11 +726,53 @@ class OdooDataGenerator:
             'date_deadline': date_deadline.strftime('%Y-%m-%d'),
         }
 
-        activity_id = self.create_record('mail.activity', vals)
-        return activity_id
+        return vals
+
+    # ==================== Orchestration ====================
+
+    def generate_all(self):
+        """Create all demo data, respecting dependencies between models"""
+        self.load_reference_data()
+        self._run_phase('sales_teams', self.create_sales_teams)
+        self._run_phase('users', self.create_users)
+
+        # A journaled run must be replayable, so it keeps a single random stream
+        if self.workers > 1 and self.journal is None:
+            # Products depend on nothing, so they are created while the
+            # partner -> lead -> opportunity chain runs
+            run_concurrently(lambda: self._run_phase('products', self.create_products),
+                             self._create_partner_chain)
+        else:
+            self._create_partner_chain()
+            self._run_phase('products', self.create_products)
+
+        # Quotations need partners, products and opportunities; activities need leads
+        self._run_phase('quotations', self.create_quotations)
+        self._run_phase('activities', self.create_activities)
+
+    def _create_partner_chain(self):
+        """Create partners, then leads, then opportunities"""
+        self._run_phase('customers', self.create_customers)
+        self._run_phase('leads', self.create_leads)
+        self._run_phase('opportunities', self.create_opportunities)
+
+    def _run_phase(self, phase, func):
+        """Run a generation phase and journal its completion"""
+        if self.journal is not None and self.journal.phase_done(phase):
+            # Replayed to rebuild IDs and the random stream; every chunk comes from the journal
+            self.progress(f"Phase '{phase}' already completed, replaying from checkpoint")
+
+        result = func()
+        if self.journal is not None:
+            self.journal.record_phase(phase)
+        return result
 
     # ==================== Utility Methods ====================
 
+    def close(self):
+        """Stop the worker threads"""
+        self.pool.close()
+
     def _weighted_random(self, distribution):
         """Select random item based on weighted distribution"""
         items = list(distribution.keys())
@@ -544,7 +793,7 @@ class OdooDataGenerator:
         print("-" * 70)
         for model, ids in self.created.items():
             model_name = model.replace('_', ' ').title()
-            print(f"  {model_name:.<50} {len(ids):>4} records")
+            print(f"  {model_name:.<50} {len(ids):>4,} records")
 
         print("\n🧪 TEST SCENARIOS INCLUDED:")
         print("-" * 70)
@@ -577,25 +826,103 @@ def main():
     parser.add_argument('--user', default=config.ODOO_USERNAME, help='Username')
     parser.add_argument('--password', default=config.ODOO_PASSWORD, help='Password')
     parser.add_argument('--clean', action='store_true', help='Clean existing demo data first (not implemented)')
+    parser.add_argument('--mode', choices=['xmlrpc', 'load', 'offline'], default='xmlrpc',
+                        help='xmlrpc: create records in Odoo; load: import them with Model.load(); '
+                             'offline: write files without Odoo')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible data')
+    parser.add_argument('--run-id',
+                        help='Identifier tagging the created records (default: derived from the seed)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue an interrupted xmlrpc run from its checkpoint journal')
+    parser.add_argument('--checkpoint', nargs='?', const=config.OUTPUT_CONFIG['checkpoint_file'],
+                        metavar='FILE',
+                        help=f"Journal completed chunks so the run can be resumed (xmlrpc mode; default file "
+                             f"{config.OUTPUT_CONFIG['checkpoint_file']}). Phases then run one after another")
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv',
+                        help='Offline output format (parquet requires pyarrow)')
+    parser.add_argument('--output-dir', default=config.OUTPUT_CONFIG['csv_output_dir'],
+                        help='Offline output directory')
+    parser.add_argument('--profile', choices=list(config.SCALE_PROFILES), default='medium',
+                        help='Data volume profile (small, medium, large, xlarge)')
+    parser.add_argument('--batch-size', type=int,
+                        help=f"Records per create call (default {config.BULK_CONFIG['batch_size']}, "
+                             f"1 = one call per record)")
+    parser.add_argument('--workers', type=int,
+                        help=f"Parallel XML-RPC connections (default {config.BULK_CONFIG['workers']}, "
+                             f"1 = sequential)")
 
     args = parser.parse_args()
 
+    journal = None
+    if (args.resume or args.checkpoint) and args.mode != 'xmlrpc':
+        parser.error('--resume and --checkpoint are only supported in xmlrpc mode (load mode reruns are idempotent)')
+    if args.resume:
+        args.checkpoint = args.checkpoint or config.OUTPUT_CONFIG['checkpoint_file']
+        journal = CheckpointJournal.resume(args.checkpoint)
+        # The replay must use the settings of the interrupted run
+        args.profile = journal.settings['profile']
+        args.seed = journal.settings['seed']
+        args.batch_size = journal.settings['batch_size']
+        args.run_id = journal.settings['run_id']
+    elif args.checkpoint and args.seed is None:
+        # Journaled runs always have a seed so they can be replayed
+        args.seed = random.randrange(2 ** 32)
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    # The same seed maps to the same run, which keeps load mode reruns idempotent
+    if args.run_id is None:
+        args.run_id = f"s{args.seed}" if args.seed is not None else datetime.now().strftime('%Y%m%d%H%M%S')
+    if not re.fullmatch(r'[A-Za-z0-9_]+', args.run_id):
+        parser.error('--run-id may only contain letters, digits and underscores')
+
+    # Large profiles switch to bulk and parallel creation unless overridden
+    bulk = apply_profile(args.profile)
+    batch_size = args.batch_size or bulk.get('batch_size') or config.BULK_CONFIG['batch_size']
+    workers = args.workers or bulk.get('workers')
+
+    if args.checkpoint and journal is None:
+        journal = CheckpointJournal.start(args.checkpoint, {
+            'profile': args.profile,
+            'seed': args.seed,
+            'batch_size': batch_size,
+            'run_id': args.run_id,
+        })
+
     print("=" * 70)
     print("GOTIT CRM - SPRINT 1 DEMO DATA GENERATOR")
     print("=" * 70 + "\n")
 
+    generator = None
     try:
-        generator = OdooDataGenerator(args.url, args.db, args.user, args.password)
-
-        # Generate data in order
-        generator.create_sales_teams()
-        generator.create_users()
-        generator.create_customers()
-        generator.create_leads()
-        generator.create_opportunities()
-        generator.create_products()
-        generator.create_quotations()
-        generator.create_activities()
+        print(f"Profile: {args.profile} ({config.DATA_VOLUME['customers']:,} customers)")
+        if args.mode != 'offline':
+            print(f"Run ID: {args.run_id} (clean up with clean_demo_data.py --run {args.run_id})")
+        if args.resume:
+            print(f"Resuming from {args.checkpoint} ({journal.chunk_count} chunks journaled)")
+        if args.mode == 'offline':
+            from offline_dataset import OfflineDataGenerator
+            generator = OfflineDataGenerator(username=args.user, batch_size=batch_size)
+        elif args.mode == 'load':
+            from odoo_load import OdooLoadGenerator
+            generator = OdooLoadGenerator(args.url, args.db, args.user, args.password,
+                                          batch_size=batch_size, workers=workers, run_id=args.run_id)
+        else:
+            generator = OdooDataGenerator(args.url, args.db, args.user, args.password,
+                                          batch_size=batch_size, workers=workers, journal=journal,
+                                          run_id=args.run_id)
+
+        # Generate data in dependency order
+        generator.generate_all()
+
+        if args.mode == 'offline':
+            generator.write_dataset(args.output_dir, args.format)
+        elif args.mode == 'load':
+            generator.load_dataset()
+
+        if journal is not None:
+            journal.complete()
 
         # Generate report
         if config.OUTPUT_CONFIG['generate_report']:
@@ -605,7 +932,14 @@ def main():
         print(f"\n❌ Error: {str(e)}")
         import traceback
         traceback.print_exc()
+        if journal is not None:
+            print(f"\nProgress is saved in {args.checkpoint}; continue with --resume")
         return 1
+    finally:
+        if generator is not None:
+            generator.close()
+        if journal is not None:
+            journal.close()
 
     return 0
 
@@ -0,0 +1,211 @@
+"""
+Normalization of matching keys for GotIt CRM
+Canonical forms of phone numbers (E.164), emails and Tax IDs (MST), so the
+same contact written differently compares equal. Every normalizer takes one
+value and has a batch variant; results are memoized because imports repeat
+the same values a lot.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+
+VN_COUNTRY_CODE = '84'
+
+# Pre-2018 11-digit mobile prefixes (without the leading 0) and their 10-digit replacements
+LEGACY_MOBILE_PREFIXES = {
+    '120': '70', '121': '79', '122': '77', '126': '76', '128': '78',
+    '123': '83', '124': '84', '125': '85', '127': '81', '129': '82',
+    '162': '32', '163': '33', '164': '34', '165': '35', '166': '36',
+    '167': '37', '168': '38', '169': '39',
+    '186': '56', '188': '58', '199': '59',
+}
+
+# MST check digit weights (digits 1-9)
+MST_WEIGHTS = (31, 29, 23, 19, 17, 13, 7, 5, 3)
+
+# Memoized values per normalizer
+CACHE_SIZE = 1 << 16
+
+# Already canonical values skip all other work
+_E164_VN = re.compile(r'\+84[1-9]\d{8,9}')
+_NATIONAL_MOBILE = re.compile(r'0[35789]\d{8}')
+_PLAIN_EMAIL = re.compile(r'[a-z0-9._%+\-]+@[a-z0-9.\-]+\.[a-z]{2,}')
+_NON_DIGITS = re.compile(r'\D')
+_ANGLE_ADDRESS = re.compile(r'<([^<>]+)>')
+_VAT_PREFIX = re.compile(r'^\s*VN', re.IGNORECASE)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_phone(value):
+    """
+    Phone number in E.164 form, or None if it is not a phone number
+
+    Vietnamese numbers may be written nationally (0912 345 678), with the
+    country code (+84 912..., 84-912..., 0084 912..., +84 (0)912...) or with
+    a pre-2018 11-digit mobile prefix (0162... becomes +8432...). Numbers of
+    other countries need a leading + or 00.
+    """
+    if not value:
+        return None
+    if _E164_VN.fullmatch(value) and (len(value) == 12 or value[3:6] not in LEGACY_MOBILE_PREFIXES):
+        return value
+    if _NATIONAL_MOBILE.fullmatch(value):
+        return f"+{VN_COUNTRY_CODE}{value[1:]}"
+
+    value = value.strip()
+    digits = value if value.isdigit() else _NON_DIGITS.sub('', value)
+    international = value.startswith('+') or value.startswith('00')
+    if value.startswith('00'):
+        digits = digits[2:]
+
+    if international:
+        if not digits.startswith(VN_COUNTRY_CODE):
+            return f"+{digits}" if 8 <= len(digits) <= 15 else None
+        national = digits[2:]
+    elif digits.startswith('0'):
+        national = digits
+    elif digits.startswith(VN_COUNTRY_CODE) and len(digits) in (11, 12):
+        national = digits[2:]
+    else:
+        national = digits
+
+    national = national.lstrip('0')
+    if len(national) == 10 and national[:3] in LEGACY_MOBILE_PREFIXES:
+        national = LEGACY_MOBILE_PREFIXES[national[:3]] + national[3:]
+
+    return f"+{VN_COUNTRY_CODE}{national}" if len(national) in (9, 10) else None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_email(value):
+    """
+    Casefolded email address, or None if it is not an email
+
+    Accepts display forms ("An Nguyen <an@x.vn>"). Unicode is NFC-normalized
+    and internationalized domains are converted to their ASCII (punycode)
+    form, so `an@pháttriển.vn` and `AN@xn--phttrin-...vn` compare equal.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if _PLAIN_EMAIL.fullmatch(value):
+        return value
+
+    if '<' in value:
+        match = _ANGLE_ADDRESS.search(value)
+        value = match.group(1).strip() if match else value
+
+    if value.isascii():
+        local, _, domain = value.lower().rpartition('@')
+    else:
+        local, _, domain = unicodedata.normalize('NFC', value).casefold().rpartition('@')
+        domain = _ascii_domain(domain)
+
+    domain = domain.rstrip('.')
+    if not local or not domain or ' ' in local or ' ' in domain:
+        return None
+    return f"{local}@{domain}"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _ascii_domain(domain):
+    """Punycode form of an internationalized domain (IDNA is slow, and domains repeat)"""
+    if domain.isascii():
+        return domain
+    try:
+        return domain.encode('idna').decode('ascii')
+    except UnicodeError:
+        return domain
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_vat(value):
+    """
+    Tax ID (MST) as 10 digits, or `<10 digits>-<3 digits>` for a branch
+
+    Separators and a VN prefix are removed. A 13-digit MST with branch 000
+    is the head office. The check digit is not verified (see is_valid_vat),
+    so mistyped numbers still match their correct duplicates.
+    """
+    if not value:
+        return None
+    if value.isdigit():
+        digits = value
+    else:
+        digits = _NON_DIGITS.sub('', _VAT_PREFIX.sub('', value))
+
+    if len(digits) == 10:
+        return digits
+    if len(digits) == 13:
+        head, branch = digits[:10], digits[10:]
+        return head if branch == '000' else f"{head}-{branch}"
+    return None
+
+
+def mst_check_digit(digits):
+    """Check digit of the first 9 MST digits (10 means no valid MST has them)"""
+    total = sum(weight * int(digit) for weight, digit in zip(MST_WEIGHTS, digits))
+    return 10 - total % 11
+
+
+def is_valid_vat(value):
+    """Whether value is a well-formed MST with a correct check digit"""
+    vat = normalize_vat(value)
+    return vat is not None and mst_check_digit(vat[:9]) == int(vat[9])
+
+
+def vat_parts(value):
+    """(head office MST, branch number or None), or None if value is not an MST"""
+    vat = normalize_vat(value)
+    if vat is None:
+        return None
+    return vat[:10], vat[11:] or None
+
+
+def _normalize_batch(normalize, values):
+    """Apply an uncached normalizer once per distinct value"""
+    distinct = dict.fromkeys(values)
+    normalized = dict(zip(distinct, map(normalize.__wrapped__, distinct)))
+    return list(map(normalized.__getitem__, values))
+
+
+def normalize_phones(values):
+    """
+    Normalize a batch of phone numbers
+
+    Each distinct value is normalized once. The LRU cache is bypassed,
+    because a large scan of mostly unique values would only churn it.
+    """
+    return _normalize_batch(normalize_phone, values)
+
+
+def normalize_emails(values):
+    """Normalize a batch of emails (see normalize_phones)"""
+    return _normalize_batch(normalize_email, values)
+
+
+def normalize_vats(values):
+    """Normalize a batch of Tax IDs (see normalize_phones)"""
+    return _normalize_batch(normalize_vat, values)
+
+
+NORMALIZERS = {
+    'vat': normalize_vat,
+    'phone': normalize_phone,
+    'email': normalize_email,
+}
+
+BATCH_NORMALIZERS = {
+    'vat': normalize_vats,
+    'phone': normalize_phones,
+    'email': normalize_emails,
+}
+
+
+def clear_caches():
+    """Forget all memoized values"""
+    for normalize in NORMALIZERS.values():
+        normalize.cache_clear()
+    _ascii_domain.cache_clear()
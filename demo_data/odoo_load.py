@@ -0,0 +1,149 @@
+"""
+Import-based ingest for GotIt CRM demo data
+Builds the linked dataset in memory and imports it with Odoo's `load` API,
+resolving relations between generated records through external IDs
+"""
+
+# Import local modules
+from generate_sprint1_data import OdooDataGenerator
+from offline_dataset import OfflineDataGenerator, SyntheticId, model_rank
+from rpc_pool import WorkerPool
+
+
+# Integer fields that hold a record ID without being a many2one (Many2oneReference)
+ID_REFERENCE_FIELDS = {'res_id'}
+
+# Models created directly in Odoo while building, so they are referenced by database ID
+REMOTE_MODELS = {'crm.stage'}
+
+# Generator methods served by the in-memory tables while building
+LOCAL_METHODS = {'create', 'read', 'write'}
+
+# Name prefix of load-mode external IDs; keeps them apart from the xmlrpc-mode
+# tags (<model>_<database id>) when both modes use the same run module
+XMLID_NAME_PREFIX = 'load_'
+
+
+def xmlid(module, record_id):
+    """External ID of a generated record"""
+    return f"{module}.{XMLID_NAME_PREFIX}{record_id.model.replace('.', '_')}_{int(record_id)}"
+
+
+class OdooLoadGenerator(OfflineDataGenerator):
+    """Generate demo data offline, then import it with Model.load()"""
+
+    def __init__(self, url, db, username, password, batch_size=None, workers=None, run_id=None):
+        """Connect to Odoo for reference data and the import calls"""
+        OdooDataGenerator.__init__(self, url, db, username, password,
+                                   batch_size=batch_size, workers=workers, run_id=run_id)
+        # External IDs live in the run's module, or Odoo's export module without a run
+        self.xmlid_module = self.run_module or '__export__'
+        self._init_tables()
+
+        # Build sequentially (reproducible with --seed); workers are used for loading
+        self.load_pool = self.pool
+        self.workers = 1
+        self.pool = WorkerPool(1)
+        self.loaded_ids = {}
+
+    def execute(self, model, method, args_list, kwargs_dict=None):
+        """Run generator calls on the in-memory tables and everything else on Odoo"""
+        if method in LOCAL_METHODS and model not in REMOTE_MODELS:
+            return OfflineDataGenerator.execute(self, model, method, args_list, kwargs_dict)
+        return OdooDataGenerator.execute(self, model, method, args_list, kwargs_dict)
+
+    def load_reference_data(self):
+        """Read the existing reference records from Odoo"""
+        return OdooDataGenerator.load_reference_data(self)
+
+    def _tag_records(self, model, record_ids, replay=False):
+        """Nothing to do: load() creates the external IDs itself"""
+
+    def close(self):
+        """Stop the worker threads used for loading"""
+        self.load_pool.close()
+        OdooDataGenerator.close(self)
+
+    def load_dataset(self):
+        """
+        Import every generated model with Model.load() in dependency order
+
+        Returns:
+            Dict of model -> number of imported records
+        """
+        print("\nImporting with Model.load()...")
+        imported = {}
+        for model in sorted(self.tables, key=model_rank):
+            rows = list(self.tables[model].values())
+            if not rows:
+                continue
+
+            fields, data = self._load_rows(model, rows)
+            chunks = [data[start:start + self.batch_size] for start in range(0, len(data), self.batch_size)]
+
+            # Rows pointing at records of the same model (parent_id) must be imported in order
+            self_referencing = any(isinstance(value, SyntheticId) and value.model == model
+                                   for row in rows for key, value in row.items() if key != 'id')
+            pool = self.pool if self_referencing else self.load_pool
+            results = pool.map(lambda chunk: self._load_chunk(model, fields, chunk), chunks)
+
+            record_ids = [record_id for chunk_ids in results for record_id in chunk_ids]
+            self.loaded_ids[model] = dict(zip((row['id'] for row in rows), record_ids))
+            imported[model] = len(record_ids)
+            self.progress(f"{model}: {len(record_ids):,} records")
+
+        return imported
+
+    def _load_chunk(self, model, fields, chunk):
+        """Import one chunk of rows and return the database IDs"""
+        result = self.execute(model, 'load', [fields, chunk])
+        errors = [message for message in result.get('messages', []) if message.get('type') == 'error']
+        if errors or not result.get('ids'):
+            details = '; '.join(message.get('message', '') for message in errors) or 'no records imported'
+            raise Exception(f"Import of {model} failed: {details[:200]}")
+        return result['ids']
+
+    def _load_rows(self, model, rows):
+        """
+        Convert rows to the (fields, data) table expected by Model.load()
+
+        Many2one columns pointing at generated records become `field/id`
+        (external ID), columns pointing at existing records `field/.id`
+        (database ID). All values are sent as strings, as in a CSV import.
+        """
+        columns = [column for column in dict.fromkeys(key for row in rows for key in row) if column != 'id']
+        to_xmlid = lambda record_id: xmlid(self.xmlid_module, record_id)
+        fields = ['id']
+        converters = [to_xmlid]
+
+        for column in columns:
+            values = [row.get(column) for row in rows]
+            synthetic = any(isinstance(value, SyntheticId) for value in values)
+
+            if column in ID_REFERENCE_FIELDS:
+                fields.append(column)
+                converters.append(self._resolve_reference)
+            elif synthetic:
+                if any(value and not isinstance(value, SyntheticId) for value in values):
+                    raise ValueError(f"{model}.{column} mixes generated and existing records")
+                fields.append(f"{column}/id")
+                converters.append(to_xmlid)
+            elif column.endswith('_id'):
+                fields.append(f"{column}/.id")
+                converters.append(str)
+            else:
+                fields.append(column)
+                converters.append(str)
+
+        keys = ['id'] + columns
+        data = [
+            [convert(row[key]) if row.get(key) not in (None, False) else '' for key, convert in zip(keys, converters)]
+            for row in rows
+        ]
+        return fields, data
+
+    def _resolve_reference(self, record_id):
+        """Database ID of an already imported generated record (for Many2oneReference fields)"""
+        if isinstance(record_id, SyntheticId):
+            return str(self.loaded_ids[record_id.model][record_id])
+        return str(record_id)
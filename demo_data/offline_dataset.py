@@ -0,0 +1,181 @@
+"""
+Offline Dataset Builder for GotIt CRM
+Builds the complete linked demo dataset in memory (no Odoo connection) and
+writes one CSV or Parquet file per model for bulk loading or test fixtures
+"""
+
+import csv
+import itertools
+import os
+from collections import defaultdict
+
+# Import local modules
+import config
+from generate_sprint1_data import OdooDataGenerator
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is optional
+    pa = None
+    pq = None
+
+
+# Files are written parents first so they can be loaded in this order
+MODEL_ORDER = [
+    'res.users',
+    'res.country',
+    'mail.activity.type',
+    'ir.model',
+    'crm.stage',
+    'crm.team',
+    'res.partner',
+    'crm.lead',
+    'product.product',
+    'sale.order',
+    'sale.order.line',
+    'mail.activity',
+]
+
+OUTPUT_FORMATS = ('csv', 'parquet')
+
+
+class SyntheticId(int):
+    """Record ID assigned offline, tagged with the model it belongs to"""
+
+    def __new__(cls, value, model):
+        synthetic_id = super().__new__(cls, value)
+        synthetic_id.model = model
+        return synthetic_id
+
+
+class OfflineDataGenerator(OdooDataGenerator):
+    """Generate demo data into in-memory tables with synthetic IDs"""
+
+    def __init__(self, username=None, batch_size=None):
+        """Initialize empty tables (no connection is made)"""
+        self.url = 'offline'
+        self.db = 'offline'
+        self.username = username or config.ODOO_USERNAME
+        self.password = None
+
+        self._init_tables()
+        self.uid = self._insert('res.users', {'login': self.username, 'name': self.username})
+
+        self._init_state(batch_size=batch_size, workers=1)
+
+    def _init_tables(self):
+        """Create the in-memory tables: model -> {id: values}, IDs are per-model sequences"""
+        self.tables = defaultdict(dict)
+        self._sequences = defaultdict(lambda: itertools.count(1))
+
+    def _insert(self, model, values):
+        """Store a row and return its synthetic ID"""
+        record_id = SyntheticId(next(self._sequences[model]), model)
+        self.tables[model][record_id] = dict(values, id=record_id)
+        return record_id
+
+    def execute(self, model, method, args_list, kwargs_dict=None):
+        """Emulate the Odoo methods used by the generator on the in-memory tables"""
+        kwargs_dict = kwargs_dict or {}
+        table = self.tables[model]
+
+        if method == 'create':
+            values = args_list[0]
+            if isinstance(values, dict):
+                return self._insert(model, values)
+            return [self._insert(model, vals) for vals in values]
+
+        if method == 'read':
+            fields = kwargs_dict.get('fields')
+            rows = [table[record_id] for record_id in args_list[0]]
+            if not fields:
+                return [dict(row) for row in rows]
+            return [{'id': row['id'], **{field: row.get(field, False) for field in fields}} for row in rows]
+
+        if method == 'write':
+            record_ids, values = args_list
+            for record_id in record_ids:
+                table[record_id].update(values)
+            return True
+
+        raise NotImplementedError(f"{model}.{method} is not available offline")
+
+    def load_reference_data(self):
+        """Create the reference rows the generated records point to"""
+        self.reference = {
+            'res.country': {'Vietnam': self._insert('res.country', {'name': 'Vietnam', 'code': 'VN'})},
+            'crm.stage': {},
+            'mail.activity.type': [self._insert('mail.activity.type', {'name': 'To Do'})],
+            'ir.model': {'crm.lead': self._insert('ir.model', {'model': 'crm.lead', 'name': 'Lead'})},
+        }
+        return self.reference
+
+    def write_dataset(self, output_dir=None, output_format='csv'):
+        """
+        Write one file per model to output_dir
+
+        Args:
+            output_dir: Target directory (defaults to OUTPUT_CONFIG['csv_output_dir'])
+            output_format: 'csv' or 'parquet'
+
+        Returns:
+            List of written file paths
+        """
+        output_dir = output_dir or config.OUTPUT_CONFIG['csv_output_dir']
+        if output_format == 'parquet' and pa is None:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)")
+        os.makedirs(output_dir, exist_ok=True)
+
+        print(f"\nWriting {output_format.upper()} files to {output_dir}...")
+        paths = []
+        for model in sorted(self.tables, key=model_rank):
+            rows = self.tables[model]
+            if not rows:
+                continue
+
+            path = os.path.join(output_dir, f"{model}.{output_format}")
+            if output_format == 'parquet':
+                write_parquet(path, rows.values(), self.batch_size)
+            else:
+                write_csv(path, rows.values())
+            paths.append(path)
+            self.progress(f"{path}: {len(rows):,} rows")
+
+        return paths
+
+
+def model_rank(model):
+    """Sort key putting models in dependency order"""
+    return MODEL_ORDER.index(model) if model in MODEL_ORDER else len(MODEL_ORDER)
+
+
+def _columns(rows):
+    """Union of the row keys in first-seen order, with id first"""
+    columns = {'id': None}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    return list(columns)
+
+
+def _cell(value):
+    """Convert Odoo-style False placeholders to empty values"""
+    return None if value is False else value
+
+
+def write_csv(path, rows):
+    """Stream rows to a CSV file"""
+    rows = list(rows)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=_columns(rows), restval='')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({key: '' if value is False or value is None else value for key, value in row.items()})
+
+
+def write_parquet(path, rows, row_group_size):
+    """Write rows to a Parquet file in row groups"""
+    rows = list(rows)
+    columns = _columns(rows)
+    table = pa.table({column: [_cell(row.get(column)) for row in rows] for column in columns})
+    pq.write_table(table, path, row_group_size=max(1, row_group_size))
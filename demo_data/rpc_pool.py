@@ -0,0 +1,70 @@
+"""
+Parallel XML-RPC helpers for the demo data scripts
+
+xmlrpc.client.ServerProxy is not thread-safe, so every worker thread gets its
+own proxy (and with it its own keep-alive HTTP connection to Odoo).
+"""
+
+import threading
+import xmlrpc.client
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ProxyPool:
+    """Thread-local XML-RPC proxies for one endpoint"""
+
+    def __init__(self, url):
+        """Create a pool for an XML-RPC endpoint URL"""
+        self.url = url
+        self._local = threading.local()
+
+    def get(self):
+        """Return the calling thread's proxy, creating it on first use"""
+        proxy = getattr(self._local, 'proxy', None)
+        if proxy is None:
+            proxy = xmlrpc.client.ServerProxy(self.url)
+            self._local.proxy = proxy
+        return proxy
+
+
+class WorkerPool:
+    """
+    Long-lived worker threads for chunked XML-RPC calls
+
+    The threads, and with them their ProxyPool proxies and keep-alive
+    connections, are reused by every map() until close().
+    """
+
+    def __init__(self, workers):
+        """Create a pool of up to `workers` threads (started on first use)"""
+        self.workers = max(1, workers)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def map(self, func, items):
+        """Apply func to every item on the pool's threads, keeping input order"""
+        items = list(items)
+        if self.workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='rpc')
+        return list(self._executor.map(func, items))
+
+    def close(self):
+        """Wait for running calls and stop the threads"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+
+def run_concurrently(*funcs):
+    """Run independent callables in parallel threads and return their results"""
+    if len(funcs) <= 1:
+        return [func() for func in funcs]
+
+    with ThreadPoolExecutor(max_workers=len(funcs)) as pool:
+        futures = [pool.submit(func) for func in funcs]
+        return [future.result() for future in futures]
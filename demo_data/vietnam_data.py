@@ -4,6 +4,12 @@ Contains realistic Vietnamese business data for Sprint 1 testing
 """
 
 import random
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch generators fall back to the random module
+    np = None
 
 # Vietnamese Company Name Components
 COMPANY_TYPES = [
@@ -349,10 +355,12 @@ def generate_tax_id():
     return ''.join([str(random.randint(0, 9)) for _ in range(10)])
 
 
+PHONE_PREFIXES = ['090', '091', '093', '094', '097', '098', '086', '088', '089']
+
+
 def generate_phone():
     """Generate a Vietnamese phone number"""
-    prefixes = ['090', '091', '093', '094', '097', '098', '086', '088', '089']
-    prefix = random.choice(prefixes)
+    prefix = random.choice(PHONE_PREFIXES)
     number = ''.join([str(random.randint(0, 9)) for _ in range(7)])
     return f"+84{prefix[1:]}{number}"
 
@@ -362,14 +370,17 @@ def generate_email(name, company_name):
     name_parts = name.lower().split()
     email_name = f"{name_parts[-1]}.{name_parts[0]}"
 
-    # Create domain from company name
+    return f"{email_name}@{_email_domain(company_name)}.vn"
+
+
+@lru_cache(maxsize=8192)
+def _email_domain(company_name):
+    """Email domain (without .vn) derived from a company name"""
     company_parts = company_name.lower().split()
     # Find the main business name (skip company type words)
     skip_words = ['công', 'ty', 'tnhh', 'cp', 'cổ', 'phần', 'trách', 'nhiệm', 'hữu', 'hạn']
     domain_parts = [p for p in company_parts if p not in skip_words][:2]
-    domain = ''.join(domain_parts)
-
-    return f"{email_name}@{domain}.vn"
+    return ''.join(domain_parts)
 
 
 def generate_address(region):
@@ -396,3 +407,201 @@ def get_random_region():
 def get_random_industry():
     """Get a random industry"""
     return random.choice(list(INDUSTRIES.keys()))
+
+
+# ==================== Batch Generators ====================
+# Return N values per call with the same distributions as the single-value
+# functions above. NumPy is used when installed; without it the same
+# lookup tables are sampled with the random module.
+
+# Precomputed lookup tables
+COMPANY_NAME_TABLE = [
+    f"{company_type} {company_name} {suffix}"
+    for company_type in COMPANY_TYPES for company_name in COMPANY_NAMES for suffix in COMPANY_SUFFIXES
+]
+PERSON_NAME_TABLES = {
+    "male": [f"{first} {middle} {last}"
+             for first in FIRST_NAMES for middle in MIDDLE_NAMES_MALE for last in LAST_NAMES_MALE],
+    "female": [f"{first} {middle} {last}"
+               for first in FIRST_NAMES for middle in MIDDLE_NAMES_FEMALE for last in LAST_NAMES_FEMALE],
+}
+PHONE_PREFIX_TABLE = [f"+84{prefix[1:]}" for prefix in PHONE_PREFIXES]
+
+
+def make_rng(seed=None):
+    """
+    Create the random source used by the batch generators
+
+    Without a seed it is derived from the random module, so random.seed()
+    still makes batch generation reproducible.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    if np is not None:
+        return np.random.default_rng(seed)
+    return random.Random(seed)
+
+
+def _rng(rng):
+    """Accept None, an integer seed or an existing random source"""
+    if rng is None or isinstance(rng, int):
+        return make_rng(rng)
+    return rng
+
+
+def _integers(rng, low, high, n):
+    """n integers drawn uniformly from [low, high)"""
+    if np is not None:
+        return rng.integers(low, high, n, dtype=np.int64)
+    return [rng.randrange(low, high) for _ in range(n)]
+
+
+def _pick(rng, table, n):
+    """n items drawn uniformly (with replacement) from a lookup table"""
+    if np is not None:
+        return [table[i] for i in rng.integers(0, len(table), n).tolist()]
+    return rng.choices(table, k=n)
+
+
+def _unique(draw, n, seen=None):
+    """Draw until n values not in seen (and not repeated) are collected"""
+    seen = set() if seen is None else seen
+    values = []
+    while len(values) < n:
+        for value in draw(n - len(values)):
+            if value not in seen:
+                seen.add(value)
+                values.append(value)
+    return values
+
+
+def generate_tax_ids(n, rng=None, unique=False):
+    """Generate n 10-digit Tax IDs (MST), optionally all different"""
+    rng = _rng(rng)
+
+    def draw(k):
+        numbers = _integers(rng, 0, 10 ** 10, k)
+        if np is not None:
+            return np.char.mod("%010d", numbers).tolist()
+        return [f"{number:010d}" for number in numbers]
+
+    return _unique(draw, n) if unique else draw(n)
+
+
+def generate_phones(n, rng=None, unique=False):
+    """Generate n Vietnamese phone numbers, optionally all different"""
+    rng = _rng(rng)
+
+    def draw(k):
+        prefixes = _pick(rng, PHONE_PREFIX_TABLE, k)
+        numbers = _integers(rng, 0, 10 ** 7, k)
+        if np is not None:
+            return np.char.add(prefixes, np.char.mod("%07d", numbers)).tolist()
+        return [f"{prefix}{number:07d}" for prefix, number in zip(prefixes, numbers)]
+
+    return _unique(draw, n) if unique else draw(n)
+
+
+def generate_person_names(n, gender="random", rng=None):
+    """Generate n Vietnamese person names"""
+    rng = _rng(rng)
+    if gender != "random":
+        return _pick(rng, PERSON_NAME_TABLES[gender], n)
+
+    males = _pick(rng, PERSON_NAME_TABLES["male"], n)
+    females = _pick(rng, PERSON_NAME_TABLES["female"], n)
+    genders = _integers(rng, 0, 2, n)
+    return [male if is_male else female for male, female, is_male in zip(males, females, genders)]
+
+
+def generate_company_names(n, rng=None):
+    """Generate n Vietnamese company names"""
+    return _pick(_rng(rng), COMPANY_NAME_TABLE, n)
+
+
+def generate_emails(names, company_names, unique=False):
+    """Generate one business email per (name, company name) pair"""
+    emails = [generate_email(name, company_name) for name, company_name in zip(names, company_names)]
+    if unique:
+        counts = {}
+        emails = [make_unique_email(email, counts) for email in emails]
+    return emails
+
+
+def make_unique_email(email, counts):
+    """
+    Number repeated emails (an.nguyen@x.vn, an.nguyen2@x.vn, ...)
+
+    counts maps each email seen so far to how often it occurred. Generated
+    local parts never end in a digit, so numbered emails cannot collide.
+    """
+    count = counts.get(email, 0) + 1
+    counts[email] = count
+    if count == 1:
+        return email
+    local, domain = email.split("@", 1)
+    return f"{local}{count}@{domain}"
+
+
+def generate_addresses(regions, rng=None):
+    """Generate one Vietnamese address per region name"""
+    rng = _rng(rng)
+    n = len(regions)
+    numbers = _integers(rng, 1, 501, n)
+    zips = _integers(rng, 70000, 100000, n)
+    district_draws = _integers(rng, 0, 1 << 30, n)
+    street_draws = _integers(rng, 0, 1 << 30, n)
+    if np is not None:
+        numbers, zips = numbers.tolist(), zips.tolist()
+        district_draws, street_draws = district_draws.tolist(), street_draws.tolist()
+
+    fallback = list(REGIONS.values())[0]
+    addresses = []
+    for region, number, zip_code, district_draw, street_draw in zip(
+            regions, numbers, zips, district_draws, street_draws):
+        region_data = REGIONS.get(region, fallback)
+        districts = region_data["districts"]
+        streets = region_data["streets"]
+        addresses.append({
+            "street": f"{number} {streets[street_draw % len(streets)]}",
+            "street2": districts[district_draw % len(districts)],
+            "city": region,
+            "country": "Vietnam",
+            "zip": str(zip_code),
+        })
+    return addresses
+
+
+class ValueStream:
+    """Hands out batch-generated values one at a time, refilling a batch when empty"""
+
+    def __init__(self, generate_batch, batch_size=10000, unique=False, rng=None):
+        """
+        Args:
+            generate_batch: Batch generator called as generate_batch(n, rng=rng)
+            batch_size: Values generated per refill
+            unique: Never hand out the same value twice
+            rng: Seed or random source (defaults to one derived from the random module)
+        """
+        self.generate_batch = generate_batch
+        self.batch_size = batch_size
+        self.unique = unique
+        self.rng = _rng(rng)
+        self.seen = set()
+        self._buffer = []
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while not self._buffer:
+            batch = self.generate_batch(self.batch_size, rng=self.rng)
+            if self.unique:
+                fresh = []
+                for value in batch:
+                    if value not in self.seen:
+                        self.seen.add(value)
+                        fresh.append(value)
+                batch = fresh
+            self._buffer = batch[::-1]
+        return self._buffer.pop()
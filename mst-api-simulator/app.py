@@ -6,9 +6,21 @@ import re
 from fastapi import FastAPI, HTTPException, Path
 from fastapi.responses import JSONResponse
 
-from models import CompanyResponse, HealthResponse
-from database import init_db, get_company_by_mst, save_company, get_stats
+from models import BatchLookupRequest, BatchLookupResponse, CompanyResponse, HealthResponse
+from database import (
+    init_db, close_db, get_company_by_mst, get_companies_by_msts, upsert_company, save_companies,
+    get_stats, get_recent_companies
+)
 from data_generator import generate_company_data
+from cache import company_cache, CACHE_PREWARM
+from serialization import company_payload, company_response, batch_response
+from executor import db_executor, ExecutorOverloaded, RequestCoalescer
+
+
+MST_PATTERN = re.compile(r'^\d{10,13}$')
+
+# Concurrent misses for the same MST share a single lookup/generation
+inflight_lookups = RequestCoalescer(db_executor)
 
 
 # Initialize FastAPI app
@@ -21,10 +33,70 @@ app = FastAPI(
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup"""
+    """Initialize database, executor and cache on startup"""
     init_db()
     print("✅ Database initialized successfully")
 
+    db_executor.start()
+
+    if CACHE_PREWARM > 0:
+        recent = await db_executor.run(get_recent_companies, limit=min(CACHE_PREWARM, company_cache.max_size))
+        for company_data in recent:
+            company_cache.put(company_data["mst"], company_payload(company_data))
+        print(f"✅ Cache pre-warmed with {len(company_cache)} companies")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the executor and close pooled database connections on shutdown"""
+    db_executor.shutdown()
+    close_db()
+
+
+@app.exception_handler(ExecutorOverloaded)
+async def overloaded_handler(request, exc):
+    """Shed load with 503 when the blocking executor is saturated"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": f"Service overloaded, retry later ({exc})"},
+        headers={"Retry-After": "1"}
+    )
+
+
+def _resolve_company(mst: str) -> dict:
+    """Look up an MST, generating and storing it when missing (blocking)"""
+    company_data = get_company_by_mst(mst)
+    if company_data:
+        return company_data
+
+    # Not found in database - generate and store in one upsert; if another
+    # process stored it first, the upsert returns that row instead
+    return upsert_company(generate_company_data(mst))
+
+
+def _resolve_companies(msts: list) -> tuple:
+    """
+    Look up many MSTs, generating and storing the missing ones (blocking)
+
+    Returns:
+        Tuple of (companies keyed by MST, number of MSTs that were generated)
+    """
+    # Resolve everything already stored with a single query
+    companies = get_companies_by_msts(msts)
+
+    # Generate and store only the missing MSTs
+    missing = [mst for mst in msts if mst not in companies]
+    generated = [generate_company_data(mst) for mst in missing]
+    inserted = save_companies(generated)
+
+    if inserted < len(generated):
+        # Some MSTs were inserted concurrently - prefer the stored rows
+        companies.update(get_companies_by_msts(missing))
+    for company in generated:
+        companies.setdefault(company["mst"], company)
+
+    return companies, len(missing)
+
 
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
 async def health_check():
@@ -37,10 +109,15 @@ async def health_check():
 
 @app.get("/stats", tags=["Statistics"])
 async def get_statistics():
-    """Get database statistics"""
+    """Get database, cache and executor statistics"""
     try:
-        stats = get_stats()
+        stats = await db_executor.run(get_stats)
+        stats["cache"] = company_cache.stats()
+        stats["executor"] = db_executor.stats()
+        stats["executor"]["coalesced"] = inflight_lookups.coalesced
         return stats
+    except ExecutorOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -78,48 +155,92 @@ async def get_company_info(
     """
 
     # Validate MST format
-    if not re.match(r'^\d{10,13}$', mst):
+    if not MST_PATTERN.match(mst):
         raise HTTPException(
             status_code=400,
             detail="Invalid MST format. MST must be 10-13 digits."
         )
 
-    # Try to get from database first
-    company_data = get_company_by_mst(mst)
-
-    if company_data:
-        # Found in database - return existing data
-        return CompanyResponse(**company_data)
+    # Hot MSTs are served straight from the in-process cache
+    cached = company_cache.get(mst)
+    if cached is not None:
+        return company_response(cached)
 
-    # Not found in database - generate new data
+    # Database lookup and generation run off the event loop
     try:
-        # Generate realistic company data
-        generated_data = generate_company_data(mst)
-
-        # Save to database
-        save_success = save_company(
-            mst=generated_data["mst"],
-            company_name=generated_data["company_name"],
-            legal_name=generated_data["legal_name"],
-            registration_date=generated_data["registration_date"],
-            status=generated_data["status"]
+        company_data = await inflight_lookups.run(mst, _resolve_company, mst)
+    except ExecutorOverloaded:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error generating company data: {str(e)}"
+        )
+
+    payload = company_payload(company_data)
+    company_cache.put(mst, payload)
+    return company_response(payload)
+
+
+@app.post(
+    "/api/v1/companies/batch",
+    response_model=BatchLookupResponse,
+    tags=["Company Lookup"],
+    summary="Get company information for many MSTs",
+    description="Retrieve company information for a list of Vietnamese Tax IDs (MST) in one call. "
+                "MSTs not in the database are generated and stored in a single transaction."
+)
+async def get_companies_batch(request: BatchLookupRequest):
+    """
+    Get company information for many MSTs at once
+
+    - **msts**: list of 10-13 digit Vietnamese Tax IDs (duplicates are ignored)
+
+    Known MSTs are resolved with one database query; only the missing ones are
+    generated, and all of them are inserted together.
+    """
+
+    # Validate MST format and drop duplicates while keeping request order
+    msts = list(dict.fromkeys(request.msts))
+    invalid = [mst for mst in msts if not MST_PATTERN.match(mst)]
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid MST format for {len(invalid)} item(s), e.g. '{invalid[0]}'. "
+                   "MST must be 10-13 digits."
         )
 
-        if not save_success:
-            # This shouldn't happen, but handle race condition
-            # Try to get from database again
-            company_data = get_company_by_mst(mst)
-            if company_data:
-                return CompanyResponse(**company_data)
+    # Serve cached MSTs from memory, resolve the rest with a single query
+    payloads = {}
+    for mst in msts:
+        cached = company_cache.get(mst)
+        if cached is not None:
+            payloads[mst] = cached
 
-        return CompanyResponse(**generated_data)
+    uncached = [mst for mst in msts if mst not in payloads]
+    found = len(payloads)
 
+    try:
+        companies, generated = await db_executor.run(_resolve_companies, uncached)
+    except ExecutorOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error generating company data: {str(e)}"
         )
 
+    for mst, company_data in companies.items():
+        payload = company_payload(company_data)
+        company_cache.put(mst, payload)
+        payloads[mst] = payload
+
+    return batch_response(
+        [payloads[mst] for mst in msts],
+        found=found + len(uncached) - generated,
+        generated=generated
+    )
+
 
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
@@ -127,7 +248,8 @@ async def not_found_handler(request, exc):
     return JSONResponse(
         status_code=404,
         content={
-            "detail": "Endpoint not found. Available endpoints: /health, /stats, /api/v1/company/{mst}"
+            "detail": "Endpoint not found. Available endpoints: /health, /stats, /api/v1/company/{mst}, "
+                      "/api/v1/companies/batch"
         }
     )
 
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Load-test and latency benchmark for the MST API simulator
+
+Runs three key distributions against the API and reports throughput and
+p50/p95/p99 latency per endpoint:
+
+- hot:   uniform lookups over a small set of MSTs that are already stored
+- cold:  every lookup is a never-seen MST (generation + insert path)
+- zipf:  Zipfian popularity over a large key space (realistic mix of both)
+
+Endpoints covered: GET /api/v1/company/{mst}, POST /api/v1/companies/batch
+and GET /stats. By default the ASGI app runs in-process against a temporary
+database; pass --url to target a running uvicorn instead. Results are written
+as JSON so runs can be compared before and after a change.
+
+Usage:
+    python benchmarks/bench_api.py --output results/baseline.json
+    python benchmarks/bench_api.py --output results/after.json --compare results/baseline.json
+    python benchmarks/bench_api.py --url http://localhost:8000 --concurrency 200
+"""
+import argparse
+import asyncio
+import bisect
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Allow running from the simulator directory or from benchmarks/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import httpx  # noqa: E402
+
+
+WORKLOADS = ("hot", "cold", "zipf")
+
+# Disjoint MST ranges per workload so one never warms another's keys
+HOT_BASE = 100_000_000
+ZIPF_BASE = 200_000_000
+COLD_BASE = 1_000_000_000
+
+
+class ZipfSampler:
+    """Draws ranks 0..n-1 with probability proportional to 1 / (rank + 1) ** s"""
+
+    def __init__(self, n: int, s: float, rng: random.Random):
+        self.rng = rng
+        weights = [1.0 / (rank + 1) ** s for rank in range(n)]
+        self.cumulative = list(itertools.accumulate(weights))
+        self.total = self.cumulative[-1]
+
+    def sample(self) -> int:
+        return bisect.bisect_left(self.cumulative, self.rng.random() * self.total)
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(workload: str, endpoint: str, latencies: list, errors: int, elapsed: float) -> dict:
+    """Build one result row (latencies in seconds, reported in ms)"""
+    latencies.sort()
+    count = len(latencies)
+    return {
+        "workload": workload,
+        "endpoint": endpoint,
+        "requests": count,
+        "errors": errors,
+        "throughput_rps": round(count / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+    }
+
+
+async def drive(make_request, total: int, concurrency: int) -> tuple:
+    """
+    Issue total requests with at most concurrency in flight
+
+    Returns:
+        Tuple of (latencies in seconds, error count, elapsed seconds)
+    """
+    counter = itertools.count()
+    latencies = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        while next(counter) < total:
+            started = time.perf_counter()
+            try:
+                response = await make_request()
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+def key_source(workload: str, args, rng: random.Random):
+    """Return a function producing the next MST for a workload"""
+    if workload == "hot":
+        return lambda: f"{HOT_BASE + rng.randrange(args.hot_keys):010d}"
+
+    if workload == "cold":
+        # Random offset keeps repeated runs against a live server cold too
+        cold = itertools.count(COLD_BASE + rng.randrange(8_000_000_000))
+        return lambda: f"{next(cold):010d}"
+
+    sampler = ZipfSampler(args.zipf_keys, args.zipf_s, rng)
+    return lambda: f"{ZIPF_BASE + sampler.sample():010d}"
+
+
+async def run_benchmark(client: httpx.AsyncClient, args) -> list:
+    """Run every workload/endpoint combination and return result rows"""
+    rng = random.Random(args.seed)
+    results = []
+
+    # Store the hot set up front so the hot workload measures pure hits
+    hot_msts = [f"{HOT_BASE + i:010d}" for i in range(args.hot_keys)]
+    for start in range(0, len(hot_msts), args.batch_size):
+        await client.post("/api/v1/companies/batch", json={"msts": hot_msts[start:start + args.batch_size]})
+
+    for workload in args.workloads:
+        next_key = key_source(workload, args, rng)
+
+        latencies, errors, elapsed = await drive(
+            lambda: client.get(f"/api/v1/company/{next_key()}"),
+            args.requests, args.concurrency
+        )
+        results.append(summarize(workload, "GET /api/v1/company/{mst}", latencies, errors, elapsed))
+
+        latencies, errors, elapsed = await drive(
+            lambda: client.post(
+                "/api/v1/companies/batch",
+                json={"msts": [next_key() for _ in range(args.batch_size)]}
+            ),
+            args.batch_requests, min(args.concurrency, args.batch_requests)
+        )
+        results.append(summarize(workload, "POST /api/v1/companies/batch", latencies, errors, elapsed))
+
+    latencies, errors, elapsed = await drive(
+        lambda: client.get("/stats"), args.stats_requests, min(args.concurrency, 16)
+    )
+    results.append(summarize("-", "GET /stats", latencies, errors, elapsed))
+
+    return results
+
+
+async def run_in_process(args) -> list:
+    """Benchmark the ASGI app in this process against a temporary database"""
+    import database
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_DIR = Path(tmp)
+        database.DB_FILE = database.DB_DIR / "bench.db"
+
+        import app
+        await app.startup_event()
+        try:
+            async with httpx.AsyncClient(app=app.app, base_url="http://bench", timeout=60) as client:
+                return await run_benchmark(client, args)
+        finally:
+            await app.shutdown_event()
+
+
+async def run_remote(args) -> list:
+    """Benchmark a running server over HTTP"""
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, timeout=60, limits=limits) as client:
+        return await run_benchmark(client, args)
+
+
+def print_table(results: list):
+    """Print results as a fixed-width table"""
+    header = f"{'workload':<8} {'endpoint':<30} {'req':>7} {'err':>5} {'req/s':>10} " \
+             f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        print(f"{row['workload']:<8} {row['endpoint']:<30} {row['requests']:>7} {row['errors']:>5} "
+              f"{row['throughput_rps']:>10,.1f} {row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f}")
+
+
+def print_comparison(results: list, baseline_file: str):
+    """Print throughput and p99 changes relative to a previous results file"""
+    baseline = {
+        (row["workload"], row["endpoint"]): row
+        for row in json.loads(Path(baseline_file).read_text())["results"]
+    }
+    print(f"\nCompared with {baseline_file}:")
+    for row in results:
+        before = baseline.get((row["workload"], row["endpoint"]))
+        if not before or not before["throughput_rps"] or not before["p99_ms"]:
+            continue
+        rps_change = (row["throughput_rps"] / before["throughput_rps"] - 1) * 100
+        p99_change = (row["p99_ms"] / before["p99_ms"] - 1) * 100
+        print(f"  {row['workload']:<8} {row['endpoint']:<30} req/s {rps_change:+7.1f}%   p99 {p99_change:+7.1f}%")
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Load-test and latency benchmark for the MST API')
+    parser.add_argument('--url', help='Target a running server instead of the in-process app')
+    parser.add_argument('--workloads', nargs='+', choices=WORKLOADS, default=list(WORKLOADS))
+    parser.add_argument('--requests', type=int, default=5000, help='Single lookups per workload')
+    parser.add_argument('--batch-requests', type=int, default=50, help='Batch calls per workload')
+    parser.add_argument('--batch-size', type=int, default=500, help='MSTs per batch call')
+    parser.add_argument('--stats-requests', type=int, default=1000, help='/stats calls')
+    parser.add_argument('--concurrency', type=int, default=50, help='Requests in flight')
+    parser.add_argument('--hot-keys', type=int, default=1000, help='Size of the hot key set')
+    parser.add_argument('--zipf-keys', type=int, default=1_000_000, help='Zipf key space size')
+    parser.add_argument('--zipf-s', type=float, default=1.1, help='Zipf exponent')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--output', help='Write results to this JSON file')
+    parser.add_argument('--compare', help='Previous results JSON file to compare against')
+    args = parser.parse_args()
+
+    runner = run_remote(args) if args.url else run_in_process(args)
+    started = time.perf_counter()
+    results = asyncio.run(runner)
+    elapsed = time.perf_counter() - started
+
+    print()
+    print_table(results)
+    print(f"\nTotal time: {elapsed:,.1f}s")
+
+    if args.compare:
+        print_comparison(results, args.compare)
+
+    if args.output:
+        report = {
+            "meta": {
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "target": args.url or "in-process",
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "parameters": {
+                    key: value for key, value in vars(args).items()
+                    if key not in ("output", "url", "compare")
+                },
+            },
+            "results": results,
+        }
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+        print(f"Results written to {output}")
+
+
+if __name__ == '__main__':
+    main()
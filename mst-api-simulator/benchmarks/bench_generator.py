@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark company data generation throughput
+
+Usage:
+    python benchmarks/bench_generator.py [--count 200000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Allow running from the simulator directory or from benchmarks/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from data_generator import generate_company_data  # noqa: E402
+
+
+def run(count: int, start_mst: int) -> float:
+    """Generate count companies and return companies per second"""
+    started = time.perf_counter()
+    for offset in range(count):
+        generate_company_data(f"{start_mst + offset:010d}")
+    return count / (time.perf_counter() - started)
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Benchmark MST company generation')
+    parser.add_argument('--count', type=int, default=200_000, help='Companies per run')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs')
+    parser.add_argument('--start', type=int, default=100_000_000, help='First MST (as integer)')
+    args = parser.parse_args()
+
+    # Same MST must always give the same company
+    assert generate_company_data("0123456789") == generate_company_data("0123456789")
+
+    results = [run(args.count, args.start) for _ in range(args.repeat)]
+    print(f"generate_company_data: {args.count:,} companies x {args.repeat} runs")
+    print(f"  best: {max(results):>10,.0f} companies/s")
+    print(f"  mean: {sum(results) / len(results):>10,.0f} companies/s")
+
+
+if __name__ == '__main__':
+    main()
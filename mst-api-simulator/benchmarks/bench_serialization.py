@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark response serialization: validated Pydantic models vs pre-encoded JSON
+
+Runs the ASGI app in-process against a temporary database with a hot cache
+and reports requests/sec for /api/v1/company/{mst} and the batch endpoint in
+both serialization modes.
+
+Usage:
+    python benchmarks/bench_serialization.py [--requests 5000] [--keys 500]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Allow running from the simulator directory or from benchmarks/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import httpx  # noqa: E402
+
+import database  # noqa: E402
+import serialization  # noqa: E402
+from cache import company_cache  # noqa: E402
+
+
+async def measure(client: httpx.AsyncClient, msts: list, requests: int, batch_size: int) -> dict:
+    """Return requests/sec for single and batch lookups against a warm cache"""
+    # Warm the cache in the current mode
+    company_cache.clear()
+    await client.post("/api/v1/companies/batch", json={"msts": msts})
+
+    started = time.perf_counter()
+    for i in range(requests):
+        response = await client.get(f"/api/v1/company/{msts[i % len(msts)]}")
+        response.raise_for_status()
+    single_rps = requests / (time.perf_counter() - started)
+
+    batch_requests = max(1, requests // 50)
+    body = {"msts": msts[:batch_size]}
+    started = time.perf_counter()
+    for _ in range(batch_requests):
+        response = await client.post("/api/v1/companies/batch", json=body)
+        response.raise_for_status()
+    batch_rps = batch_requests / (time.perf_counter() - started)
+
+    return {"single_rps": single_rps, "batch_rps": batch_rps}
+
+
+async def run(requests: int, keys: int, batch_size: int):
+    """Compare both serialization modes"""
+    import app
+
+    await app.startup_event()
+    msts = [f"{mst:010d}" for mst in range(100_000_000, 100_000_000 + keys)]
+    results = {}
+
+    async with httpx.AsyncClient(app=app.app, base_url="http://bench") as client:
+        for label, fast in (("pydantic (before)", False), ("pre-encoded (after)", True)):
+            serialization.FAST_SERIALIZATION = fast
+            results[label] = await measure(client, msts, requests, batch_size)
+
+        # Both modes must produce the same JSON document
+        serialization.FAST_SERIALIZATION = False
+        company_cache.clear()
+        slow = (await client.get(f"/api/v1/company/{msts[0]}")).json()
+        serialization.FAST_SERIALIZATION = True
+        company_cache.clear()
+        fast = (await client.get(f"/api/v1/company/{msts[0]}")).json()
+        assert slow == fast, (slow, fast)
+
+    await app.shutdown_event()
+    return results
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Benchmark MST API response serialization')
+    parser.add_argument('--requests', type=int, default=5000, help='Single lookups per mode')
+    parser.add_argument('--keys', type=int, default=500, help='Distinct MSTs (all cached)')
+    parser.add_argument('--batch-size', type=int, default=500, help='MSTs per batch request')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_DIR = Path(tmp)
+        database.DB_FILE = database.DB_DIR / "bench.db"
+        results = asyncio.run(run(args.requests, args.keys, min(args.batch_size, args.keys)))
+
+    encoder = "orjson" if serialization.orjson is not None else "json"
+    print(f"Serialization benchmark (hot cache, encoder: {encoder})")
+    print(f"  {'mode':<22} {'single req/s':>14} {'batch req/s':>14}")
+    for label, result in results.items():
+        print(f"  {label:<22} {result['single_rps']:>14,.0f} {result['batch_rps']:>14,.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Pooled SQLite connections for the MST database
+
+Each thread (uvicorn worker thread, executor thread, CLI process) gets one
+long-lived connection that is opened on first use and reused afterwards, so
+lookups no longer pay for opening the file, parsing the schema and taking
+fresh locks. Connections run in WAL mode so readers never block the writer.
+"""
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# Tunable pragmas (override via environment variables)
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": os.getenv("MST_DB_SYNCHRONOUS", "NORMAL"),
+    # Negative cache_size is in KiB (64 MiB per connection by default)
+    "cache_size": int(os.getenv("MST_DB_CACHE_SIZE", "-65536")),
+    "mmap_size": int(os.getenv("MST_DB_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "temp_store": "MEMORY",
+    "busy_timeout": int(os.getenv("MST_DB_BUSY_TIMEOUT_MS", "5000")),
+}
+
+# Number of compiled statements kept per connection (sqlite3 statement cache)
+STATEMENT_CACHE_SIZE = int(os.getenv("MST_DB_STATEMENT_CACHE", "256"))
+
+
+class ConnectionPool:
+    """Per-thread reusable SQLite connections with WAL journaling"""
+
+    def __init__(self, db_file: Path, pragmas: Optional[Dict[str, object]] = None):
+        """
+        Args:
+            db_file: Path to the SQLite database file
+            pragmas: PRAGMA name/value pairs applied to every new connection
+        """
+        self.db_file = Path(db_file)
+        self.pragmas = dict(DEFAULT_PRAGMAS if pragmas is None else pragmas)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self.opened = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection"""
+        conn = sqlite3.connect(
+            str(self.db_file),
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+
+        with self._lock:
+            self._connections.append(conn)
+            self.opened += 1
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def close_all(self):
+        """Close every connection handed out by this pool"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        # Threads still holding a closed connection will reopen on next use
+        self._local = threading.local()
+
+    def stats(self) -> dict:
+        """Pool statistics for the /stats endpoint"""
+        with self._lock:
+            open_connections = len(self._connections)
+        return {
+            "open_connections": open_connections,
+            "connections_opened": self.opened,
+            "journal_mode": self.pragmas.get("journal_mode"),
+        }
@@ -1,17 +1,18 @@
 """
-Generate realistic Vietnamese company data using Faker
+Generate realistic Vietnamese company data
+
+Faker is only used once, at import time, to build fixed name/city/word pools.
+Each company is then generated from its own ``random.Random`` instance seeded
+by the MST, so generation is deterministic, touches no shared RNG state and
+is safe to run concurrently from many threads.
 """
 import random
-from datetime import date, timedelta
+from datetime import date
 from faker import Faker
 
 from models import CompanyStatus
 
 
-# Initialize Faker with Vietnamese locale
-fake = Faker('vi_VN')
-
-
 # Common Vietnamese company types
 COMPANY_TYPES = [
     "Công ty TNHH",  # Limited Liability Company
@@ -36,23 +37,63 @@ BUSINESS_SECTORS = [
 ]
 
 
-def generate_company_name() -> str:
+# Number of Faker draws used to build each name pool
+POOL_SAMPLES = 1000
+POOL_SEED = 0
+
+
+def _build_pool(faker_method, transform=None) -> tuple:
+    """Draw values from a seeded Faker method into a sorted, de-duplicated pool"""
+    values = set()
+    for _ in range(POOL_SAMPLES):
+        value = faker_method()
+        if transform:
+            value = transform(value)
+        values.add(value)
+    return tuple(sorted(values))
+
+
+def _build_pools() -> dict:
+    """Precompute all name pools from a Vietnamese-locale Faker"""
+    fake = Faker('vi_VN')
+    fake.seed_instance(POOL_SEED)
+    return {
+        "first_names": _build_pool(fake.first_name),
+        "last_names": _build_pool(fake.last_name),
+        "cities": _build_pool(fake.city, lambda city: city.split()[0]),
+        "words": _build_pool(fake.word, str.title),
+    }
+
+
+# Pools are built once per process; generation only indexes into them
+_POOLS = _build_pools()
+FIRST_NAMES = _POOLS["first_names"]
+LAST_NAMES = _POOLS["last_names"]
+CITY_WORDS = _POOLS["cities"]
+TITLE_WORDS = _POOLS["words"]
+
+# Registration dates are drawn as ordinals between 1990-01-01 and 2024-12-31
+REGISTRATION_START = date(1990, 1, 1).toordinal()
+REGISTRATION_END = date(2024, 12, 31).toordinal()
+
+
+def generate_company_name(rng=random) -> str:
     """Generate a realistic Vietnamese company name"""
-    company_type = random.choice(COMPANY_TYPES)
-    sector = random.choice(BUSINESS_SECTORS)
+    company_type = rng.choice(COMPANY_TYPES)
+    sector = rng.choice(BUSINESS_SECTORS)
 
     # Mix of real-sounding Vietnamese business names
-    name_patterns = [
-        f"{fake.first_name()} {fake.last_name()}",  # Personal name
-        f"{sector} {fake.city().split()[0]}",  # Sector + City
-        f"{fake.word().title()} {sector}",  # Random word + Sector
-        f"Tập đoàn {fake.last_name()}",  # Group + Name
-    ]
-
-    base_name = random.choice(name_patterns)
-    full_name = f"{company_type} {base_name}"
+    pattern = rng.randrange(4)
+    if pattern == 0:
+        base_name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"  # Personal name
+    elif pattern == 1:
+        base_name = f"{sector} {rng.choice(CITY_WORDS)}"  # Sector + City
+    elif pattern == 2:
+        base_name = f"{rng.choice(TITLE_WORDS)} {sector}"  # Random word + Sector
+    else:
+        base_name = f"Tập đoàn {rng.choice(LAST_NAMES)}"  # Group + Name
 
-    return full_name
+    return f"{company_type} {base_name}"
 
 
 def generate_legal_name(company_name: str) -> str:
@@ -60,31 +101,19 @@ def generate_legal_name(company_name: str) -> str:
     return company_name.upper()
 
 
-def generate_registration_date() -> date:
+def generate_registration_date(rng=random) -> date:
     """Generate a random registration date between 1990 and 2024"""
-    start_date = date(1990, 1, 1)
-    end_date = date(2024, 12, 31)
+    return date.fromordinal(rng.randint(REGISTRATION_START, REGISTRATION_END))
 
-    # Calculate days between dates
-    days_between = (end_date - start_date).days
 
-    # Generate random number of days
-    random_days = random.randint(0, days_between)
-
-    # Create random date
-    registration_date = start_date + timedelta(days=random_days)
-
-    return registration_date
-
-
-def generate_company_status() -> CompanyStatus:
+def generate_company_status(rng=random) -> CompanyStatus:
     """
     Generate company status with weighted distribution:
     - Active: 80%
     - Suspended: 15%
     - Dissolved: 5%
     """
-    rand = random.random()
+    rand = rng.random()
 
     if rand < 0.80:
         return CompanyStatus.ACTIVE
@@ -98,21 +127,22 @@ def generate_company_data(mst: str) -> dict:
     """
     Generate complete company data for a given MST
 
+    The same MST always yields the same company, and branch MSTs (13 digits)
+    share their parent's 10-digit seed.
+
     Args:
         mst: Mã số thuế (Tax ID)
 
     Returns:
         Dictionary with generated company information
     """
-    # Set seed based on MST for consistent generation for same MST
-    # (useful for testing)
-    Faker.seed(int(mst[:10]))
-    random.seed(int(mst[:10]))
+    # Private RNG seeded by the MST - no global state, no locking
+    rng = random.Random(int(mst[:10]))
 
-    company_name = generate_company_name()
+    company_name = generate_company_name(rng)
     legal_name = generate_legal_name(company_name)
-    registration_date = generate_registration_date()
-    status = generate_company_status()
+    registration_date = generate_registration_date(rng)
+    status = generate_company_status(rng)
 
     return {
         "mst": mst,
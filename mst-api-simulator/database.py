@@ -1,29 +1,66 @@
 """
 SQLite database operations for MST company data
 """
+import os
 import sqlite3
-from datetime import date, datetime
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 from contextlib import contextmanager
 
-from models import CompanyStatus
+from connection_pool import ConnectionPool
 
 
 # Database file path
 DB_DIR = Path("/app/data")
 DB_FILE = DB_DIR / "mst_database.db"
 
+# Upper bound on bound parameters per statement (SQLite >= 3.32 default)
+SQLITE_MAX_VARIABLES = 32766
+
+# How often the in-memory stats mirror is reloaded from company_counters
+STATS_REFRESH_SECONDS = float(os.getenv("MST_STATS_REFRESH", "1"))
+
+# Per-minute insert counters older than this are pruned
+INSERT_RATE_WINDOW_MINUTES = 60
+
+
+# Shared connection pool (created lazily so DB_FILE can be overridden)
+_pool: Optional[ConnectionPool] = None
+
+
+def get_pool() -> ConnectionPool:
+    """Return the process-wide connection pool"""
+    global _pool
+    if _pool is None:
+        _pool = ConnectionPool(DB_FILE)
+    return _pool
+
+
+def close_db():
+    """Close all pooled connections (called on shutdown)"""
+    global _pool
+    if _pool is not None:
+        _pool.close_all()
+        _pool = None
+
 
 @contextmanager
 def get_db_connection():
-    """Context manager for database connections"""
-    conn = sqlite3.connect(str(DB_FILE), check_same_thread=False)
-    conn.row_factory = sqlite3.Row
+    """Context manager for database connections
+
+    Connections are reused per thread; any transaction left open by a failed
+    operation is rolled back so the next caller starts clean.
+    """
+    conn = get_pool().acquire()
     try:
         yield conn
-    finally:
-        conn.close()
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
 
 
 def init_db():
@@ -45,12 +82,105 @@ def init_db():
             )
         """)
 
-        # Create index on MST for faster lookups
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_mst ON companies(mst)
-        """)
+        # The UNIQUE constraint already indexes mst; drop the duplicate index older databases have
+        cursor.execute("DROP INDEX IF EXISTS idx_mst")
+
+        _init_counters(cursor)
+
+        conn.commit()
+
+
+def _init_counters(cursor: sqlite3.Cursor):
+    """
+    Create the company_counters table and the triggers that maintain it
+
+    Counters are keyed by name ('total', 'status:<status>', 'year:<yyyy>',
+    'minute:<yyyy-mm-ddThh:mm>') and updated inside the same transaction as
+    every insert or delete, so /stats never has to scan companies.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS company_counters (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """)
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_companies_count_insert
+        AFTER INSERT ON companies
+        BEGIN
+            INSERT INTO company_counters (name, value) VALUES
+                ('total', 1),
+                ('status:' || NEW.status, 1),
+                ('year:' || substr(NEW.registration_date, 1, 4), 1),
+                ('minute:' || substr(NEW.created_at, 1, 16), 1)
+            ON CONFLICT(name) DO UPDATE SET value = value + 1;
+        END
+    """)
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_companies_count_delete
+        AFTER DELETE ON companies
+        BEGIN
+            UPDATE company_counters SET value = value - 1
+            WHERE name IN (
+                'total',
+                'status:' || OLD.status,
+                'year:' || substr(OLD.registration_date, 1, 4)
+            );
+        END
+    """)
+
+    # Backfill once for databases created before the counters existed
+    cursor.execute("SELECT 1 FROM company_counters WHERE name = 'total'")
+    if cursor.fetchone() is None:
+        _backfill_counters(cursor)
+
+
+def _backfill_counters(cursor: sqlite3.Cursor):
+    """
+    Recompute the total, status and year counters from the companies table
 
+    A single grouped COUNT(*) scans companies once; the three counter kinds
+    are summed from its groups. Minute buckets are left alone.
+    """
+    cursor.execute("DELETE FROM company_counters WHERE name NOT LIKE 'minute:%'")
+    cursor.execute("""
+        WITH groups AS MATERIALIZED (
+            SELECT status, substr(registration_date, 1, 4) AS year, COUNT(*) AS n
+            FROM companies
+            GROUP BY status, year
+        )
+        INSERT INTO company_counters (name, value)
+        SELECT 'total', COALESCE(SUM(n), 0) FROM groups
+        UNION ALL
+        SELECT 'status:' || status, SUM(n) FROM groups GROUP BY status
+        UNION ALL
+        SELECT 'year:' || year, SUM(n) FROM groups GROUP BY year
+    """)
+
+
+@contextmanager
+def counters_suspended():
+    """
+    Drop the counter triggers for a bulk load, then recreate them and recount
+
+    Per-row trigger writes dominate large executemany loads; one recount
+    afterwards is much cheaper. Rows inserted meanwhile are not counted in
+    the per-minute insert rate.
+    """
+    with get_db_connection() as conn:
+        conn.execute("DROP TRIGGER IF EXISTS trg_companies_count_insert")
+        conn.execute("DROP TRIGGER IF EXISTS trg_companies_count_delete")
         conn.commit()
+    try:
+        yield
+    finally:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            _init_counters(cursor)
+            _backfill_counters(cursor)
+            conn.commit()
 
 
 def get_company_by_mst(mst: str) -> Optional[dict]:
@@ -73,68 +203,221 @@ def get_company_by_mst(mst: str) -> Optional[dict]:
 
         row = cursor.fetchone()
         if row:
-            return {
-                "mst": row["mst"],
-                "company_name": row["company_name"],
-                "legal_name": row["legal_name"],
-                "registration_date": row["registration_date"],
-                "status": row["status"]
-            }
+            return _row_to_dict(row)
         return None
 
 
-def save_company(
-    mst: str,
-    company_name: str,
-    legal_name: str,
-    registration_date: date,
-    status: CompanyStatus
-) -> bool:
+def get_companies_by_msts(msts: Iterable[str]) -> Dict[str, dict]:
     """
-    Save company information to database
+    Retrieve company information for many MSTs at once
+
+    Known MSTs are resolved with a single ``WHERE mst IN (...)`` query per
+    ``SQLITE_MAX_VARIABLES`` keys instead of one connection per MST.
 
     Args:
-        mst: Mã số thuế (Tax ID)
-        company_name: Company name
-        legal_name: Legal company name
-        registration_date: Registration date
-        status: Company status
+        msts: Mã số thuế (Tax IDs) to look up
 
     Returns:
-        True if saved successfully, False otherwise
+        Dictionary mapping each found MST to its company information
     """
-    try:
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
+    msts = list(msts)
+    found = {}
+    if not msts:
+        return found
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        for start in range(0, len(msts), SQLITE_MAX_VARIABLES):
+            chunk = msts[start:start + SQLITE_MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"""
+                SELECT mst, company_name, legal_name, registration_date, status
+                FROM companies
+                WHERE mst IN ({placeholders})
+            """, chunk)
+            for row in cursor.fetchall():
+                found[row["mst"]] = _row_to_dict(row)
+
+    return found
+
+
+def get_recent_companies(limit: int) -> List[dict]:
+    """
+    Return the most recently stored companies (used to pre-warm the cache)
+
+    Args:
+        limit: Maximum number of companies to return
+
+    Returns:
+        List of company dictionaries, newest first
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT mst, company_name, legal_name, registration_date, status
+            FROM companies
+            ORDER BY id DESC
+            LIMIT ?
+        """, (limit,))
+        return [_row_to_dict(row) for row in cursor.fetchall()]
+
+
+def _row_to_dict(row: sqlite3.Row) -> dict:
+    """Convert a companies row into a response dictionary"""
+    return {
+        "mst": row["mst"],
+        "company_name": row["company_name"],
+        "legal_name": row["legal_name"],
+        "registration_date": row["registration_date"],
+        "status": row["status"]
+    }
+
+
+def upsert_company(company: dict) -> dict:
+    """
+    Insert a generated company unless its MST already exists
+
+    Uses a single ``INSERT ... ON CONFLICT(mst) DO NOTHING RETURNING`` statement;
+    only when another writer won the race is the stored row read back.
+
+    Args:
+        company: Company dictionary as returned by generate_company_data
+
+    Returns:
+        Dictionary with the stored company information
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO companies (mst, company_name, legal_name, registration_date, status, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(mst) DO NOTHING
+            RETURNING mst, company_name, legal_name, registration_date, status
+        """, (
+            company["mst"],
+            company["company_name"],
+            company["legal_name"],
+            company["registration_date"].isoformat(),
+            company["status"].value,
+            datetime.now().isoformat()
+        ))
+        row = cursor.fetchone()
+
+        if row is None:
+            # MST already exists - return the stored row
             cursor.execute("""
-                INSERT INTO companies (mst, company_name, legal_name, registration_date, status, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                mst,
-                company_name,
-                legal_name,
-                registration_date.isoformat(),
-                status.value,
-                datetime.now().isoformat()
-            ))
-            conn.commit()
-            return True
-    except sqlite3.IntegrityError:
-        # MST already exists
-        return False
+                SELECT mst, company_name, legal_name, registration_date, status
+                FROM companies
+                WHERE mst = ?
+            """, (company["mst"],))
+            row = cursor.fetchone()
 
+        conn.commit()
+        return _row_to_dict(row)
 
-def get_stats() -> dict:
-    """Get database statistics"""
+
+def save_companies(companies: List[dict]) -> int:
+    """
+    Save many generated companies in a single transaction
+
+    MSTs that already exist (e.g. inserted by a concurrent request) are
+    skipped rather than aborting the whole batch.
+
+    Args:
+        companies: Company dictionaries as returned by generate_company_data
+
+    Returns:
+        Number of rows actually inserted
+    """
+    if not companies:
+        return 0
+
+    created_at = datetime.now().isoformat()
+    rows = [
+        (
+            company["mst"],
+            company["company_name"],
+            company["legal_name"],
+            company["registration_date"].isoformat(),
+            company["status"].value,
+            created_at
+        )
+        for company in companies
+    ]
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT OR IGNORE INTO companies (mst, company_name, legal_name, registration_date, status, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, rows)
+        conn.commit()
+        # rowcount excludes rows written by the counter triggers
+        return cursor.rowcount
+
+
+# In-memory mirror of company_counters, reloaded at most every STATS_REFRESH_SECONDS
+_stats_lock = threading.Lock()
+_stats_mirror = {"loaded_at": 0.0, "counters": {}}
+
+
+def _load_counters() -> Dict[str, int]:
+    """Prune expired minute buckets and read all counters"""
+    cutoff = datetime.now() - timedelta(minutes=INSERT_RATE_WINDOW_MINUTES)
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) as total FROM companies")
-        total = cursor.fetchone()["total"]
+        cursor.execute("""
+            DELETE FROM company_counters
+            WHERE name >= 'minute:' AND name < ?
+        """, (f"minute:{cutoff.isoformat()[:16]}",))
+        conn.commit()
+
+        cursor.execute("SELECT name, value FROM company_counters")
+        return {row["name"]: row["value"] for row in cursor.fetchall()}
+
+
+def get_counters(max_age: float = STATS_REFRESH_SECONDS) -> Dict[str, int]:
+    """
+    Return the counters mirror, reloading it if older than max_age seconds
+
+    The counters table holds a bounded number of rows (statuses, years and at
+    most an hour of minute buckets), so a reload costs the same no matter how
+    many companies are stored.
+    """
+    with _stats_lock:
+        if time.monotonic() - _stats_mirror["loaded_at"] >= max_age:
+            _stats_mirror["counters"] = _load_counters()
+            _stats_mirror["loaded_at"] = time.monotonic()
+        return _stats_mirror["counters"]
+
+
+def get_stats() -> dict:
+    """Get database statistics from the maintained counters"""
+    counters = get_counters()
+
+    by_status = {}
+    by_year = {}
+    by_minute = {}
+    for name, value in counters.items():
+        kind, _, key = name.partition(":")
+        if kind == "status" and value:
+            by_status[key] = value
+        elif kind == "year" and value:
+            by_year[key] = value
+        elif kind == "minute":
+            by_minute[key] = value
 
-        cursor.execute("SELECT status, COUNT(*) as count FROM companies GROUP BY status")
-        status_counts = {row["status"]: row["count"] for row in cursor.fetchall()}
+    current_minute = datetime.now().isoformat()[:16]
+    recent_inserts = sum(by_minute.values())
 
-        return {
-            "total_companies": total,
-            "by_status": status_counts
-        }
+    return {
+        "total_companies": counters.get("total", 0),
+        "by_status": by_status,
+        "by_registration_year": dict(sorted(by_year.items())),
+        "inserts_per_minute": {
+            "current_minute": by_minute.get(current_minute, 0),
+            "average_last_hour": round(recent_inserts / INSERT_RATE_WINDOW_MINUTES, 2),
+            "by_minute": dict(sorted(by_minute.items())),
+        },
+        "connection_pool": get_pool().stats()
+    }
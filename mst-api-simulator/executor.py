@@ -0,0 +1,150 @@
+"""
+Bounded thread-pool executor for blocking work
+
+SQLite access and company generation are synchronous. Running them directly
+inside ``async def`` handlers blocks the event loop, so a single slow write
+stalls every other request on the worker. Handlers instead submit that work
+here: a fixed pool of threads runs it, a semaphore caps how many calls are in
+flight, and callers beyond the queue limit are rejected immediately so the
+service sheds load instead of letting latency grow without bound.
+"""
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+# Executor configuration (override via environment variables)
+DB_WORKERS = int(os.getenv("MST_DB_WORKERS", "8"))
+MAX_PENDING = int(os.getenv("MST_MAX_PENDING", "1000"))
+QUEUE_TIMEOUT_SECONDS = float(os.getenv("MST_QUEUE_TIMEOUT", "10"))
+
+
+class ExecutorOverloaded(Exception):
+    """Raised when the executor queue is full or a task waited too long"""
+
+
+class BlockingExecutor:
+    """Runs blocking callables on a bounded thread pool with back-pressure"""
+
+    def __init__(
+        self,
+        workers: int = DB_WORKERS,
+        max_pending: int = MAX_PENDING,
+        queue_timeout: float = QUEUE_TIMEOUT_SECONDS
+    ):
+        """
+        Args:
+            workers: Threads (and maximum concurrently running tasks)
+            max_pending: Maximum tasks waiting or running before rejecting new ones
+            queue_timeout: Seconds a task may wait for a free worker
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def start(self):
+        """Create the thread pool (called on application startup)"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="mst-db")
+            self._semaphore = asyncio.Semaphore(self.workers)
+
+    def shutdown(self):
+        """Stop the thread pool, waiting for running tasks"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+            self._semaphore = None
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run func(*args, **kwargs) on the pool without blocking the event loop
+
+        Raises:
+            ExecutorOverloaded: If too many tasks are queued or the wait times out
+        """
+        if self._pool is None:
+            self.start()
+
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise ExecutorOverloaded(f"{self.pending} tasks pending")
+
+        self.pending += 1
+        try:
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                raise ExecutorOverloaded(f"No worker free after {self.queue_timeout}s")
+
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._pool, partial(func, *args, **kwargs))
+            finally:
+                self._semaphore.release()
+                self.completed += 1
+        finally:
+            self.pending -= 1
+
+    def stats(self) -> dict:
+        """Executor statistics for the /stats endpoint"""
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+class RequestCoalescer:
+    """Shares one in-flight executor call between concurrent callers with the same key"""
+
+    def __init__(self, executor: BlockingExecutor):
+        """
+        Args:
+            executor: Executor that runs the first caller's function
+        """
+        self.executor = executor
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run func on the executor unless a call for key is already in flight,
+        in which case wait for and return that call's result
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # Shield so one cancelled waiter does not cancel the shared call
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self.executor.run(func, *args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so asyncio does not warn when nobody else waited
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+
+# Shared executor for database access and company generation
+db_executor = BlockingExecutor()
@@ -3,9 +3,14 @@ Pydantic models for MST API responses
 """
 from datetime import date
 from enum import Enum
+from typing import List
 from pydantic import BaseModel, Field
 
 
+# Maximum number of MSTs accepted by the batch lookup endpoint
+MAX_BATCH_SIZE = 5000
+
+
 class CompanyStatus(str, Enum):
     """Company status enum"""
     ACTIVE = "active"
@@ -33,6 +38,30 @@ class CompanyResponse(BaseModel):
         }
 
 
+class BatchLookupRequest(BaseModel):
+    """Request model for batch company lookup"""
+    msts: List[str] = Field(
+        ...,
+        description="Danh sách mã số thuế (Tax IDs)",
+        min_length=1,
+        max_length=MAX_BATCH_SIZE
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "msts": ["0123456789", "0312345678", "0109876543001"]
+            }
+        }
+
+
+class BatchLookupResponse(BaseModel):
+    """Response model for batch company lookup"""
+    companies: List[CompanyResponse] = Field(..., description="Companies in request order (duplicates removed)")
+    found: int = Field(..., description="Number of MSTs already in the database")
+    generated: int = Field(..., description="Number of MSTs generated by this request")
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
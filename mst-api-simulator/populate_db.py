@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Bulk pre-population of the MST database
+
+Fills the companies table with synthetic companies for a contiguous MST range
+so staging lookups run against a realistic, multi-million-row registry.
+
+Usage:
+    python populate_db.py --count 5000000 --start 0100000000 --workers 4
+"""
+import argparse
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import database
+from data_generator import generate_company_data
+
+
+def generate_chunk(start: int, count: int) -> list:
+    """Generate companies for MSTs start .. start + count - 1"""
+    return [generate_company_data(f"{mst:010d}") for mst in range(start, start + count)]
+
+
+def iter_chunks(start: int, count: int, batch_size: int):
+    """Yield (chunk_start, chunk_count) pairs covering the MST range"""
+    end = start + count
+    for chunk_start in range(start, end, batch_size):
+        yield chunk_start, min(batch_size, end - chunk_start)
+
+
+def iter_generated(start: int, count: int, batch_size: int, workers: int):
+    """Yield generated chunks in MST order, optionally using a process pool"""
+    chunks = iter_chunks(start, count, batch_size)
+
+    if workers <= 1:
+        for chunk_start, chunk_count in chunks:
+            yield generate_chunk(chunk_start, chunk_count)
+        return
+
+    # Keep a bounded number of chunks in flight so memory stays flat
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for chunk_start, chunk_count in chunks:
+            in_flight.append(pool.submit(generate_chunk, chunk_start, chunk_count))
+            if len(in_flight) >= workers * 2:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def populate(start: int, count: int, batch_size: int, workers: int) -> int:
+    """
+    Insert count generated companies starting at MST start
+
+    The counter triggers are dropped for the load and the counters are
+    recomputed once at the end (see database.counters_suspended).
+
+    Args:
+        start: First MST as an integer (zero-padded to 10 digits)
+        count: Number of MSTs to generate
+        batch_size: Rows per executemany call and transaction
+        workers: Generator processes (1 = generate in this process)
+
+    Returns:
+        Number of rows actually inserted (existing MSTs are skipped)
+    """
+    database.init_db()
+
+    with database.get_db_connection() as conn:
+        # Durability is irrelevant for a reproducible bulk load
+        conn.execute("PRAGMA synchronous = OFF")
+
+    inserted = 0
+    processed = 0
+    started = time.perf_counter()
+
+    with database.counters_suspended():
+        for companies in iter_generated(start, count, batch_size, workers):
+            inserted += database.save_companies(companies)
+            processed += len(companies)
+
+            elapsed = time.perf_counter() - started
+            print(f"  → {processed:,}/{count:,} processed, {inserted:,} inserted "
+                  f"({processed / elapsed:,.0f} rows/s)")
+        print("  → Recounting statistics...")
+
+    with database.get_db_connection() as conn:
+        conn.execute("ANALYZE companies")
+        conn.commit()
+        conn.execute(f"PRAGMA synchronous = {database.get_pool().pragmas['synchronous']}")
+
+    return inserted
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Bulk pre-populate the MST database')
+    parser.add_argument('--count', type=int, required=True, help='Number of companies to generate')
+    parser.add_argument('--start', default='0100000000', help='First MST of the range (10 digits)')
+    parser.add_argument('--batch-size', type=int, default=50_000, help='Rows per transaction')
+    parser.add_argument('--workers', type=int, default=1, help='Generator processes')
+    parser.add_argument('--db', default=str(database.DB_FILE), help='SQLite database file')
+
+    args = parser.parse_args()
+
+    if not args.start.isdigit() or len(args.start) != 10:
+        parser.error("--start must be a 10-digit MST")
+    start = int(args.start)
+    if start + args.count > 10 ** 10:
+        parser.error("MST range exceeds 10 digits")
+
+    database.DB_FILE = Path(args.db)
+    database.DB_DIR = database.DB_FILE.parent
+
+    print("=" * 70)
+    print("MST DATABASE BULK POPULATION")
+    print("=" * 70)
+    print(f"\nDatabase: {database.DB_FILE}")
+    print(f"Range: {start:010d} .. {start + args.count - 1:010d} ({args.count:,} MSTs)")
+    print(f"Workers: {args.workers}, batch size: {args.batch_size:,}\n")
+
+    started = time.perf_counter()
+    try:
+        inserted = populate(start, args.count, args.batch_size, args.workers)
+    finally:
+        database.close_db()
+
+    elapsed = time.perf_counter() - started
+    print(f"\n✓ Inserted {inserted:,} companies in {elapsed:,.1f}s "
+          f"({args.count / elapsed:,.0f} rows/s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
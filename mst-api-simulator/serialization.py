@@ -0,0 +1,93 @@
+"""
+Response serialization for company lookups
+
+Rows read from our own database (or produced by our own generator) are
+already valid, so in fast mode they are encoded straight to JSON bytes once
+and those bytes are cached and returned as-is. That skips building a Pydantic
+model, revalidating it and running FastAPI's JSON encoder on every hit.
+orjson is used when installed, with the standard library as a fallback.
+"""
+import json
+import os
+from typing import List, Union
+
+from fastapi.responses import Response
+
+from models import BatchLookupResponse, CompanyResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Serve pre-encoded JSON bytes instead of validated Pydantic models
+FAST_SERIALIZATION = os.getenv("MST_FAST_SERIALIZATION", "1") not in ("0", "false", "False")
+
+
+def dumps(value) -> bytes:
+    """Encode a JSON-compatible value to UTF-8 bytes"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_company(company_data: dict) -> bytes:
+    """
+    Encode a company dictionary to JSON bytes without revalidation
+
+    Accepts both database rows (ISO date / status strings) and generator
+    output (date / CompanyStatus objects).
+    """
+    status = company_data["status"]
+    return dumps({
+        "mst": company_data["mst"],
+        "company_name": company_data["company_name"],
+        "legal_name": company_data["legal_name"],
+        "registration_date": str(company_data["registration_date"]),
+        "status": getattr(status, "value", status),
+    })
+
+
+class PreEncodedJSONResponse(Response):
+    """JSON response whose body is already encoded"""
+    media_type = "application/json"
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+Payload = Union[bytes, CompanyResponse]
+
+
+def company_payload(company_data: dict) -> Payload:
+    """Build the cacheable payload for a company (bytes in fast mode)"""
+    if FAST_SERIALIZATION:
+        return encode_company(company_data)
+    return CompanyResponse(**company_data)
+
+
+def company_response(payload: Payload):
+    """Turn a cached payload into an endpoint return value"""
+    if isinstance(payload, bytes):
+        return PreEncodedJSONResponse(payload)
+    return payload
+
+
+def batch_response(payloads: List[Payload], found: int, generated: int):
+    """Assemble the batch lookup response from per-company payloads"""
+    if payloads and all(isinstance(payload, bytes) for payload in payloads):
+        body = b"".join((
+            b'{"companies":[',
+            b",".join(payloads),
+            b'],"found":', str(found).encode(),
+            b',"generated":', str(generated).encode(),
+            b"}",
+        ))
+        return PreEncodedJSONResponse(body)
+
+    companies = [
+        CompanyResponse.model_validate_json(payload) if isinstance(payload, bytes) else payload
+        for payload in payloads
+    ]
+    return BatchLookupResponse(companies=companies, found=found, generated=generated)